@@ -23,11 +23,10 @@ import struct
 
 from pycdlib import dates
 from pycdlib import pycdlibexception
-from pycdlib import utils
 
 # For mypy annotations
 if False:  # pylint: disable=using-constant-test
-    from typing import Dict, List, Optional  # NOQA pylint: disable=unused-import
+    from typing import Any, Callable, Dict, List, Optional, Tuple  # NOQA pylint: disable=unused-import
     # NOTE: this has to be here to avoid circular deps
     from pycdlib import dr  # NOQA pylint: disable=unused-import
 
@@ -41,6 +40,107 @@ EXT_ID_112 = b'IEEE_P1282'
 EXT_DES_112 = b'THE IEEE P1282 PROTOCOL PROVIDES SUPPORT FOR POSIX FILE SYSTEM SEMANTICS'
 EXT_SRC_112 = b'PLEASE CONTACT THE IEEE STANDARDS DEPARTMENT, PISCATAWAY, NJ, USA FOR THE P1282 SPECIFICATION'
 
+# The lengths of the Rock Ridge records that always have the same size.
+_SP_LEN = 7
+_RR_LEN = 5
+_CE_LEN = 28
+_ES_LEN = 5
+_PN_LEN = 20
+_CL_LEN = 12
+_PL_LEN = 12
+_RE_LEN = 4
+_ST_LEN = 4
+
+# Pre-compiled structures for the fixed-size portions of the Rock Ridge
+# records.  These are used on every parse and record of every directory
+# record on the ISO, so we avoid having the struct module re-parse the format
+# strings each time.  Each record class keeps its structures in its FMT class
+# attributes; the layouts that several records share are defined once here.
+# Where possible the structures include the 2-byte signature, so that the
+# same structure can both parse a record and generate it with a single call.
+#
+# The SUSP header that starts every System Use entry: the 2-byte signature,
+# the length, and the entry version.  This also covers the records that are
+# not followed by any other fixed fields.
+_SUSP_HDR_FMT = struct.Struct('=2sBB')
+# The SUSP header followed by a single byte; the RR, ES, SL, AL, NM, and TF
+# records (or record headers) all look like this.
+_SUSP_HDR_BYTE_FMT = struct.Struct('=2sBBB')
+# The SUSP header followed by a both-endian 32-bit logical block number, as
+# used by the CL and PL records.  The big-endian half is kept as bytes; see
+# below.
+_LOG_BLOCK_NUM_FMT = struct.Struct('<2sBBL4s')
+# The flags and length that start each SL and AL component.
+_COMP_HDR_FMT = struct.Struct('=BB')
+
+# The halves of a single both-endian 32-bit field.  When recording, the
+# both-endian fields are generated by packing the little-endian half as an
+# integer and dropping in the big-endian half as pre-packed bytes, rather than
+# byte-swapping each value in Python and packing it little-endian.
+_LE32_FMT = struct.Struct('<L')
+_BE32_FMT = struct.Struct('>L')
+
+# The bit in the RR record flags that corresponds to each of the Rock Ridge
+# fields that it can mark as present.
+_RR_PX = 1 << 0
+_RR_PN = 1 << 1
+_RR_SL = 1 << 2
+_RR_NM = 1 << 3
+_RR_CL = 1 << 4
+_RR_PL = 1 << 5
+_RR_RE = 1 << 6
+_RR_TF = 1 << 7
+_RR_FIELD_BITS = {
+    'PX': _RR_PX,
+    'PN': _RR_PN,
+    'SL': _RR_SL,
+    'NM': _RR_NM,
+    'CL': _RR_CL,
+    'PL': _RR_PL,
+    'RE': _RR_RE,
+    'TF': _RR_TF,
+}
+
+# For each possible Symbolic Link component flags byte, the fixed name that
+# the component stands for (dot, dotdot, or root), or None if the name is
+# carried in the component data.
+_SL_FLAG_NAMES = tuple(b'.' if flags & (1 << 1) else
+                       b'..' if flags & (1 << 2) else
+                       b'/' if flags & (1 << 3) else
+                       None for flags in range(256))
+
+# For each possible Symbolic Link component flags byte, whether it is valid.
+# At most one of the continued, dot, dotdot, and root bits may be set, and
+# none of the reserved bits may be.
+_SL_VALID_FLAGS = bytearray(flags in (0, 1, 2, 4, 8) for flags in range(256))
+
+# Each of the timestamps that can be present in a TF record, in the order they
+# are recorded, along with the bit in the TF flags that marks it as present.
+_TF_FIELDS = (
+    ('creation_time', 1 << 0),
+    ('access_time', 1 << 1),
+    ('modification_time', 1 << 2),
+    ('attribute_change_time', 1 << 3),
+    ('backup_time', 1 << 4),
+    ('expiration_time', 1 << 5),
+    ('effective_time', 1 << 6),
+)
+
+# The TF flag bit that selects 17-byte Volume Descriptor style timestamps over
+# 7-byte Directory Record style ones, and the mask of the timestamp bits.
+_TF_LONG_FORM = 1 << 7
+_TF_TIMESTAMPS_MASK = 0x7f
+
+# The Symbolic Link component names that are encoded purely in the component
+# flags, and so take up no space in the component data.
+_SL_SPECIAL = frozenset((b'.', b'..', b'/'))
+
+# The on-disk form of the dot, dotdot, and root Symbolic Link components,
+# which are always the same flags byte followed by a zero length.
+_SL_DOT_RECORD = _COMP_HDR_FMT.pack(1 << 1, 0)
+_SL_DOTDOT_RECORD = _COMP_HDR_FMT.pack(1 << 2, 0)
+_SL_ROOT_RECORD = _COMP_HDR_FMT.pack(1 << 3, 0)
+
 
 class RRSPRecord(object):
     """
@@ -50,32 +150,37 @@ class RRSPRecord(object):
     """
     __slots__ = ('_initialized', 'bytes_to_skip')
 
-    FMT = '=BBBBB'
+    FMT = struct.Struct('=2sBBBBB')
+
+    # The record is only constant in the (overwhelmingly common) case that no
+    # bytes are skipped.
+    _NO_SKIP_RECORD = FMT.pack(b'SP', _SP_LEN, SU_ENTRY_VERSION, 0xbe, 0xef, 0)
 
     def __init__(self):
         # type: () -> None
         self._initialized = False
 
-    def parse(self, rrstr):
-        # type: (bytes) -> None
+    def parse(self, rrstr, offset=0):
+        # type: (bytes, int) -> None
         """
         Parse a Rock Ridge Sharing Protocol record out of a string.
 
         Parameters:
          rrstr - The string to parse the record out of.
+         offset - The offset into the string at which the record starts.
         Returns:
          Nothing.
         """
         if self._initialized:
             raise pycdlibexception.PyCdlibInternalError('SP record already initialized')
 
-        (su_len, su_entry_version_unused, check_byte1, check_byte2,
-         self.bytes_to_skip) = struct.unpack_from(self.FMT, rrstr[:7], 2)
+        (sig_unused, su_len, su_entry_version_unused, check_byte1, check_byte2,
+         self.bytes_to_skip) = self.FMT.unpack_from(rrstr, offset)
 
         # We assume that the caller has already checked the su_entry_version,
         # so we don't bother.
 
-        if su_len != RRSPRecord.length():
+        if su_len != _SP_LEN:
             raise pycdlibexception.PyCdlibInvalidISO('Invalid length on rock ridge extension')
         if check_byte1 != 0xbe or check_byte2 != 0xef:
             raise pycdlibexception.PyCdlibInvalidISO('Invalid check bytes on rock ridge extension')
@@ -111,9 +216,11 @@ class RRSPRecord(object):
         if not self._initialized:
             raise pycdlibexception.PyCdlibInternalError('SP record not initialized')
 
-        return b'SP' + struct.pack(self.FMT, RRSPRecord.length(),
-                                   SU_ENTRY_VERSION, 0xbe, 0xef,
-                                   self.bytes_to_skip)
+        if self.bytes_to_skip == 0:
+            return self._NO_SKIP_RECORD
+
+        return self.FMT.pack(b'SP', _SP_LEN, SU_ENTRY_VERSION,
+                             0xbe, 0xef, self.bytes_to_skip)
 
     @staticmethod
     def length():
@@ -127,7 +234,7 @@ class RRSPRecord(object):
         Returns:
          The length of this record in bytes.
         """
-        return 7
+        return _SP_LEN
 
 
 class RRRRRecord(object):
@@ -137,33 +244,34 @@ class RRRRRecord(object):
     """
     __slots__ = ('_initialized', 'rr_flags')
 
-    FMT = '=BBB'
+    FMT = _SUSP_HDR_BYTE_FMT
 
     def __init__(self):
         # type: () -> None
         self.rr_flags = 0
         self._initialized = False
 
-    def parse(self, rrstr):
-        # type: (bytes) -> None
+    def parse(self, rrstr, offset=0):
+        # type: (bytes, int) -> None
         """
         Parse a Rock Ridge Rock Ridge record out of a string.
 
         Parameters:
          rrstr - The string to parse the record out of.
+         offset - The offset into the string at which the record starts.
         Returns:
          Nothing.
         """
         if self._initialized:
             raise pycdlibexception.PyCdlibInternalError('RR record already initialized')
 
-        (su_len, su_entry_version_unused,
-         self.rr_flags) = struct.unpack_from(self.FMT, rrstr[:5], 2)
+        (sig_unused, su_len, su_entry_version_unused,
+         self.rr_flags) = self.FMT.unpack_from(rrstr, offset)
 
         # We assume that the caller has already checked the su_entry_version,
         # so we don't bother.
 
-        if su_len != RRRRRecord.length():
+        if su_len != _RR_LEN:
             raise pycdlibexception.PyCdlibInvalidISO('Invalid length on rock ridge extension')
 
         self._initialized = True
@@ -198,22 +306,30 @@ class RRRRRecord(object):
         if not self._initialized:
             raise pycdlibexception.PyCdlibInternalError('RR record not initialized')
 
-        field_to_bit = {
-            'PX': 0,
-            'PN': 1,
-            'SL': 2,
-            'NM': 3,
-            'CL': 4,
-            'PL': 5,
-            'RE': 6,
-            'TF': 7
-        }
-
         try:
-            self.rr_flags |= (1 << field_to_bit[fieldname])
+            self.rr_flags |= _RR_FIELD_BITS[fieldname]
         except KeyError:
             raise pycdlibexception.PyCdlibInternalError('Unknown RR field name %s' % (fieldname))  # pylint: disable=raise-missing-from
 
+    def append_fields(self, fields):
+        # type: (int) -> None
+        """
+        Mark a set of fields as present in the Rock Ridge records.
+
+        Parameters:
+         fields - The bitmask of the fields to mark as present, as it appears
+                  in the flags of the RR record.
+        Returns:
+         Nothing.
+        """
+        if not self._initialized:
+            raise pycdlibexception.PyCdlibInternalError('RR record not initialized')
+
+        if fields & ~0xff:
+            raise pycdlibexception.PyCdlibInternalError('Unknown RR field bits 0x%x' % (fields))
+
+        self.rr_flags |= fields
+
     def record(self):
         # type: () -> bytes
         """
@@ -227,8 +343,8 @@ class RRRRRecord(object):
         if not self._initialized:
             raise pycdlibexception.PyCdlibInternalError('RR record not initialized')
 
-        return b'RR' + struct.pack(self.FMT, RRRRRecord.length(),
-                                   SU_ENTRY_VERSION, self.rr_flags)
+        return self.FMT.pack(b'RR', _RR_LEN, SU_ENTRY_VERSION,
+                             self.rr_flags)
 
     @staticmethod
     def length():
@@ -242,7 +358,7 @@ class RRRRRecord(object):
         Returns:
          The length of this record in bytes.
         """
-        return 5
+        return _RR_LEN
 
 
 class RRCERecord(object):
@@ -254,42 +370,52 @@ class RRCERecord(object):
     __slots__ = ('_initialized', 'bl_cont_area', 'offset_cont_area',
                  'len_cont_area')
 
-    FMT = '<BBLLLLLL'
+    # The both-endian fields are parsed by reading all of the little-endian
+    # halves with one structure (skipping the big-endian ones), and all of the
+    # big-endian halves with another (skipping the little-endian ones).  The
+    # two sets of values can then be compared directly, without having to
+    # byte-swap each value in Python.  BE_FMT starts after the 4-byte SUSP
+    # header.
+    LE_FMT = struct.Struct('<BBL4xL4xL4x')
+    BE_FMT = struct.Struct('>4xL4xL4xL')
+    FMT = struct.Struct('<2sBBL4sL4sL4s')
 
     def __init__(self):
         # type: () -> None
         self._initialized = False
 
-    def parse(self, rrstr):
-        # type: (bytes) -> None
+    def parse(self, rrstr, offset=0):
+        # type: (bytes, int) -> None
         """
         Parse a Rock Ridge Continuation Entry record out of a string.
 
         Parameters:
          rrstr - The string to parse the record out of.
+         offset - The offset into the string at which the record starts.
         Returns:
          Nothing.
         """
         if self._initialized:
             raise pycdlibexception.PyCdlibInternalError('CE record already initialized')
 
-        (su_len, su_entry_version_unused, bl_cont_area_le, bl_cont_area_be,
-         offset_cont_area_le, offset_cont_area_be,
-         len_cont_area_le, len_cont_area_be) = struct.unpack_from(self.FMT, rrstr[:28], 2)
+        (su_len, su_entry_version_unused, bl_cont_area_le, offset_cont_area_le,
+         len_cont_area_le) = self.LE_FMT.unpack_from(rrstr, offset + 2)
+        (bl_cont_area_be, offset_cont_area_be,
+         len_cont_area_be) = self.BE_FMT.unpack_from(rrstr, offset + 4)
 
         # We assume that the caller has already checked the su_entry_version,
         # so we don't bother.
 
-        if su_len != RRCERecord.length():
+        if su_len != _CE_LEN:
             raise pycdlibexception.PyCdlibInvalidISO('Invalid length on rock ridge extension')
 
-        if bl_cont_area_le != utils.swab_32bit(bl_cont_area_be):
+        if bl_cont_area_le != bl_cont_area_be:
             raise pycdlibexception.PyCdlibInvalidISO('CE record big and little endian continuation area do not agree')
 
-        if offset_cont_area_le != utils.swab_32bit(offset_cont_area_be):
+        if offset_cont_area_le != offset_cont_area_be:
             raise pycdlibexception.PyCdlibInvalidISO('CE record big and little endian continuation area offset do not agree')
 
-        if len_cont_area_le != utils.swab_32bit(len_cont_area_be):
+        if len_cont_area_le != len_cont_area_be:
             raise pycdlibexception.PyCdlibInvalidISO('CE record big and little endian continuation area length do not agree')
 
         self.bl_cont_area = bl_cont_area_le
@@ -376,15 +502,15 @@ class RRCERecord(object):
         if not self._initialized:
             raise pycdlibexception.PyCdlibInternalError('CE record not initialized')
 
-        return b'CE' + struct.pack(self.FMT,
-                                   RRCERecord.length(),
-                                   SU_ENTRY_VERSION,
-                                   self.bl_cont_area,
-                                   utils.swab_32bit(self.bl_cont_area),
-                                   self.offset_cont_area,
-                                   utils.swab_32bit(self.offset_cont_area),
-                                   self.len_cont_area,
-                                   utils.swab_32bit(self.len_cont_area))
+        be32 = _BE32_FMT.pack
+        return self.FMT.pack(b'CE', _CE_LEN,
+                             SU_ENTRY_VERSION,
+                             self.bl_cont_area,
+                             be32(self.bl_cont_area),
+                             self.offset_cont_area,
+                             be32(self.offset_cont_area),
+                             self.len_cont_area,
+                             be32(self.len_cont_area))
 
     @staticmethod
     def length():
@@ -398,7 +524,7 @@ class RRCERecord(object):
         Returns:
          The length of this record in bytes.
         """
-        return 28
+        return _CE_LEN
 
 
 class RRPXRecord(object):
@@ -410,7 +536,11 @@ class RRPXRecord(object):
     __slots__ = ('_initialized', 'posix_file_mode', 'posix_file_links',
                  'posix_user_id', 'posix_group_id', 'posix_serial_number')
 
-    FMT = '<BBLLLLLLLL'
+    # See RRCERecord for how the both-endian fields are parsed.
+    LE_FMT = struct.Struct('<BBL4xL4xL4xL4x')
+    BE_FMT = struct.Struct('>4xL4xL4xL4xL')
+    FMT_36 = struct.Struct('<2sBBL4sL4sL4sL4s')
+    FMT_44 = struct.Struct('<2sBBL4sL4sL4sL4sL4s')
 
     def __init__(self):
         # type: () -> None
@@ -422,37 +552,39 @@ class RRPXRecord(object):
 
         self._initialized = False
 
-    def parse(self, rrstr):
-        # type: (bytes) -> int
+    def parse(self, rrstr, offset=0):
+        # type: (bytes, int) -> int
         """
         Parse a Rock Ridge POSIX File Attributes record out of a string.
 
         Parameters:
          rrstr - The string to parse the record out of.
+         offset - The offset into the string at which the record starts.
         Returns:
          The length of the record in bytes.
         """
         if self._initialized:
             raise pycdlibexception.PyCdlibInternalError('PX record already initialized')
 
-        (su_len, su_entry_version_unused, posix_file_mode_le, posix_file_mode_be,
-         posix_file_links_le, posix_file_links_be, posix_file_user_id_le,
-         posix_file_user_id_be, posix_file_group_id_le,
-         posix_file_group_id_be) = struct.unpack_from(self.FMT, rrstr[:38], 2)
+        (su_len, su_entry_version_unused, posix_file_mode_le,
+         posix_file_links_le, posix_file_user_id_le,
+         posix_file_group_id_le) = self.LE_FMT.unpack_from(rrstr, offset + 2)
+        (posix_file_mode_be, posix_file_links_be, posix_file_user_id_be,
+         posix_file_group_id_be) = self.BE_FMT.unpack_from(rrstr, offset + 4)
 
         # We assume that the caller has already checked the su_entry_version,
         # so we don't bother.
 
-        if posix_file_mode_le != utils.swab_32bit(posix_file_mode_be):
+        if posix_file_mode_le != posix_file_mode_be:
             raise pycdlibexception.PyCdlibInvalidISO('PX record big and little-endian file mode do not agree')
 
-        if posix_file_links_le != utils.swab_32bit(posix_file_links_be):
+        if posix_file_links_le != posix_file_links_be:
             raise pycdlibexception.PyCdlibInvalidISO('PX record big and little-endian file links do not agree')
 
-        if posix_file_user_id_le != utils.swab_32bit(posix_file_user_id_be):
+        if posix_file_user_id_le != posix_file_user_id_be:
             raise pycdlibexception.PyCdlibInvalidISO('PX record big and little-endian file user ID do not agree')
 
-        if posix_file_group_id_le != utils.swab_32bit(posix_file_group_id_be):
+        if posix_file_group_id_le != posix_file_group_id_be:
             raise pycdlibexception.PyCdlibInvalidISO('PX record big and little-endian file group ID do not agree')
 
         # In Rock Ridge 1.09 and 1.10, there is no serial number so the su_len
@@ -461,10 +593,9 @@ class RRPXRecord(object):
         if su_len == 36:
             posix_file_serial_number_le = 0
         elif su_len == 44:
-            (posix_file_serial_number_le,
-             posix_file_serial_number_be) = struct.unpack_from('<LL',
-                                                               rrstr[:44], 36)
-            if posix_file_serial_number_le != utils.swab_32bit(posix_file_serial_number_be):
+            (posix_file_serial_number_le,) = _LE32_FMT.unpack_from(rrstr, offset + 36)
+            (posix_file_serial_number_be,) = _BE32_FMT.unpack_from(rrstr, offset + 40)
+            if posix_file_serial_number_le != posix_file_serial_number_be:
                 raise pycdlibexception.PyCdlibInvalidISO('PX record big and little-endian file serial number do not agree')
         else:
             raise pycdlibexception.PyCdlibInvalidISO('Invalid length on Rock Ridge PX record')
@@ -514,23 +645,33 @@ class RRPXRecord(object):
         if not self._initialized:
             raise pycdlibexception.PyCdlibInternalError('PX record not initialized')
 
-        outlist = [b'PX', struct.pack(self.FMT, RRPXRecord.length(rr_version),
-                                      SU_ENTRY_VERSION, self.posix_file_mode,
-                                      utils.swab_32bit(self.posix_file_mode),
-                                      self.posix_file_links,
-                                      utils.swab_32bit(self.posix_file_links),
-                                      self.posix_user_id,
-                                      utils.swab_32bit(self.posix_user_id),
-                                      self.posix_group_id,
-                                      utils.swab_32bit(self.posix_group_id))]
-        if rr_version == '1.12':
-            outlist.append(struct.pack('<LL', self.posix_serial_number,
-                                       utils.swab_32bit(self.posix_serial_number)))
+        su_len = RRPXRecord.length(rr_version)
+        be32 = _BE32_FMT.pack
+        if su_len == 44:
+            return self.FMT_44.pack(b'PX', su_len, SU_ENTRY_VERSION,
+                                    self.posix_file_mode,
+                                    be32(self.posix_file_mode),
+                                    self.posix_file_links,
+                                    be32(self.posix_file_links),
+                                    self.posix_user_id,
+                                    be32(self.posix_user_id),
+                                    self.posix_group_id,
+                                    be32(self.posix_group_id),
+                                    self.posix_serial_number,
+                                    be32(self.posix_serial_number))
+
         # The rr_version can never be "wrong" at this point; if it was, it would
         # have thrown an exception earlier when calling length().  So just skip
         # any potential checks here.
-
-        return b''.join(outlist)
+        return self.FMT_36.pack(b'PX', su_len, SU_ENTRY_VERSION,
+                                self.posix_file_mode,
+                                be32(self.posix_file_mode),
+                                self.posix_file_links,
+                                be32(self.posix_file_links),
+                                self.posix_user_id,
+                                be32(self.posix_user_id),
+                                self.posix_group_id,
+                                be32(self.posix_group_id))
 
     @staticmethod
     def length(rr_version):
@@ -558,7 +699,7 @@ class RRERRecord(object):
     """A class that represents a Rock Ridge Extensions Reference record."""
     __slots__ = ('_initialized', 'ext_id', 'ext_des', 'ext_src', 'ext_ver')
 
-    FMT = '=BBBBBB'
+    FMT = struct.Struct('=2sBBBBBB')
 
     def __init__(self):
         # type: () -> None
@@ -567,39 +708,45 @@ class RRERRecord(object):
         self.ext_src = b''
         self._initialized = False
 
-    def parse(self, rrstr):
-        # type: (bytes) -> None
+    def parse(self, rrstr, offset=0):
+        # type: (bytes, int) -> None
         """
         Parse a Rock Ridge Extensions Reference record out of a string.
 
         Parameters:
          rrstr - The string to parse the record out of.
+         offset - The offset into the string at which the record starts.
         Returns:
          Nothing.
         """
         if self._initialized:
             raise pycdlibexception.PyCdlibInternalError('ER record already initialized')
 
-        (su_len, su_entry_version_unused, len_id, len_des, len_src,
-         self.ext_ver) = struct.unpack_from(self.FMT, rrstr[:8], 2)
+        (sig_unused, su_len, su_entry_version_unused, len_id, len_des, len_src,
+         self.ext_ver) = self.FMT.unpack_from(rrstr, offset)
 
         # We assume that the caller has already checked the su_entry_version,
         # so we don't bother.
 
         # Ensure that the length isn't crazy
-        if su_len > len(rrstr):
+        if su_len > len(rrstr) - offset:
             raise pycdlibexception.PyCdlibInvalidISO('Length of ER record much too long')
 
         # Also ensure that the combination of len_id, len_des, and len_src
         # doesn't overrun su_len; because of the check above, this means it
-        # can't overrun len(rrstr) either
+        # can't overrun the end of rrstr either
         total_length = len_id + len_des + len_src
         if total_length > su_len:
             raise pycdlibexception.PyCdlibInvalidISO('Combined length of ER ID, des, and src longer than record')
 
-        fmtstr = '=%ds%ds%ds' % (len_id, len_des, len_src)
-        (self.ext_id, self.ext_des,
-         self.ext_src) = struct.unpack_from(fmtstr, rrstr, 8)
+        # The three fields are laid out back-to-back after the 8-byte header;
+        # slice them out directly rather than building (and having struct
+        # compile) a format string specific to these lengths.
+        des_offset = offset + 8 + len_id
+        src_offset = des_offset + len_des
+        self.ext_id = rrstr[offset + 8:des_offset]
+        self.ext_des = rrstr[des_offset:src_offset]
+        self.ext_src = rrstr[src_offset:src_offset + len_src]
 
         self._initialized = True
 
@@ -639,13 +786,14 @@ class RRERRecord(object):
         if not self._initialized:
             raise pycdlibexception.PyCdlibInternalError('ER record not initialized')
 
-        return b'ER' + struct.pack(self.FMT,
-                                   RRERRecord.length(self.ext_id, self.ext_des, self.ext_src),
-                                   SU_ENTRY_VERSION,
-                                   len(self.ext_id),
-                                   len(self.ext_des),
-                                   len(self.ext_src),
-                                   self.ext_ver) + self.ext_id + self.ext_des + self.ext_src
+        return b''.join([self.FMT.pack(b'ER',
+                                       RRERRecord.length(self.ext_id, self.ext_des, self.ext_src),
+                                       SU_ENTRY_VERSION,
+                                       len(self.ext_id),
+                                       len(self.ext_des),
+                                       len(self.ext_src),
+                                       self.ext_ver),
+                         self.ext_id, self.ext_des, self.ext_src])
 
     @staticmethod
     def length(ext_id, ext_des, ext_src):
@@ -668,20 +816,21 @@ class RRESRecord(object):
     """A class that represents a Rock Ridge Extension Selector record."""
     __slots__ = ('_initialized', 'extension_sequence')
 
-    FMT = '=BBB'
+    FMT = _SUSP_HDR_BYTE_FMT
 
     def __init__(self):
         # type: () -> None
         self.extension_sequence = 0
         self._initialized = False
 
-    def parse(self, rrstr):
-        # type: (bytes) -> None
+    def parse(self, rrstr, offset=0):
+        # type: (bytes, int) -> None
         """
         Parse a Rock Ridge Extension Selector record out of a string.
 
         Parameters:
          rrstr - The string to parse the record out of.
+         offset - The offset into the string at which the record starts.
         Returns:
          Nothing.
         """
@@ -691,9 +840,9 @@ class RRESRecord(object):
         # We assume that the caller has already checked the su_entry_version,
         # so we don't bother.
 
-        (su_len, su_entry_version_unused,
-         self.extension_sequence) = struct.unpack_from(self.FMT, rrstr[:5], 2)
-        if su_len != RRESRecord.length():
+        (sig_unused, su_len, su_entry_version_unused,
+         self.extension_sequence) = self.FMT.unpack_from(rrstr, offset)
+        if su_len != _ES_LEN:
             raise pycdlibexception.PyCdlibInvalidISO('Invalid length on rock ridge extension')
 
         self._initialized = True
@@ -727,10 +876,10 @@ class RRESRecord(object):
         if not self._initialized:
             raise pycdlibexception.PyCdlibInternalError('ES record not initialized')
 
-        return b'ES' + struct.pack(self.FMT,
-                                   RRESRecord.length(),
-                                   SU_ENTRY_VERSION,
-                                   self.extension_sequence)
+        return self.FMT.pack(b'ES',
+                             _ES_LEN,
+                             SU_ENTRY_VERSION,
+                             self.extension_sequence)
 
     @staticmethod
     def length():
@@ -744,7 +893,7 @@ class RRESRecord(object):
         Returns:
          The length of this record in bytes.
         """
-        return 5
+        return _ES_LEN
 
 
 class RRPNRecord(object):
@@ -754,7 +903,10 @@ class RRPNRecord(object):
     """
     __slots__ = ('_initialized', 'dev_t_high', 'dev_t_low')
 
-    FMT = '<BBLLLL'
+    # See RRCERecord for how the both-endian fields are parsed.
+    LE_FMT = struct.Struct('<BBL4xL4x')
+    BE_FMT = struct.Struct('>4xL4xL')
+    FMT = struct.Struct('<2sBBL4sL4s')
 
     def __init__(self):
         # type: () -> None
@@ -762,32 +914,34 @@ class RRPNRecord(object):
         self.dev_t_low = 0
         self._initialized = False
 
-    def parse(self, rrstr):
-        # type: (bytes) -> None
+    def parse(self, rrstr, offset=0):
+        # type: (bytes, int) -> None
         """
         Parse a Rock Ridge POSIX Device Number record out of a string.
 
         Parameters:
          rrstr - The string to parse the record out of.
+         offset - The offset into the string at which the record starts.
         Returns:
          Nothing.
         """
         if self._initialized:
             raise pycdlibexception.PyCdlibInternalError('PN record already initialized')
 
-        (su_len, su_entry_version_unused, dev_t_high_le, dev_t_high_be,
-         dev_t_low_le, dev_t_low_be) = struct.unpack_from(self.FMT, rrstr[:20], 2)
+        (su_len, su_entry_version_unused, dev_t_high_le,
+         dev_t_low_le) = self.LE_FMT.unpack_from(rrstr, offset + 2)
+        (dev_t_high_be, dev_t_low_be) = self.BE_FMT.unpack_from(rrstr, offset + 4)
 
         # We assume that the caller has already checked the su_entry_version,
         # so we don't bother.
 
-        if su_len != RRPNRecord.length():
+        if su_len != _PN_LEN:
             raise pycdlibexception.PyCdlibInvalidISO('Invalid length on rock ridge extension')
 
-        if dev_t_high_le != utils.swab_32bit(dev_t_high_be):
+        if dev_t_high_le != dev_t_high_be:
             raise pycdlibexception.PyCdlibInvalidISO('Dev_t high little-endian does not match big-endian')
 
-        if dev_t_low_le != utils.swab_32bit(dev_t_low_be):
+        if dev_t_low_le != dev_t_low_be:
             raise pycdlibexception.PyCdlibInvalidISO('Dev_t low little-endian does not match big-endian')
 
         self.dev_t_high = dev_t_high_le
@@ -828,13 +982,13 @@ class RRPNRecord(object):
         if not self._initialized:
             raise pycdlibexception.PyCdlibInternalError('PN record not initialized')
 
-        return b'PN' + struct.pack(self.FMT,
-                                   RRPNRecord.length(),
-                                   SU_ENTRY_VERSION,
-                                   self.dev_t_high,
-                                   utils.swab_32bit(self.dev_t_high),
-                                   self.dev_t_low,
-                                   utils.swab_32bit(self.dev_t_low))
+        be32 = _BE32_FMT.pack
+        return self.FMT.pack(b'PN', _PN_LEN,
+                             SU_ENTRY_VERSION,
+                             self.dev_t_high,
+                             be32(self.dev_t_high),
+                             self.dev_t_low,
+                             be32(self.dev_t_low))
 
     @staticmethod
     def length():
@@ -848,7 +1002,42 @@ class RRPNRecord(object):
         Returns:
          The length of this record in bytes.
         """
-        return 20
+        return _PN_LEN
+
+
+def _parse_components(rrstr, offset, su_len, component_class):
+    # type: (bytes, int, int, Callable[[int, int, bytes], Any]) -> List[Any]
+    """
+    An internal function to parse the component area of a Symbolic Link or
+    Arbitrary Attribute record.  Both records share the same layout for the
+    components: a 1-byte flags field, a 1-byte length field, and then the
+    data, repeated until the end of the record.
+
+    Parameters:
+     rrstr - The string containing the record.
+     offset - The offset into the string at which the record starts.
+     su_len - The length of the record, including the 5 byte header.
+     component_class - The class to use to construct each component.
+    Returns:
+     A list of the components parsed out of the record.
+    """
+    components = []
+    cr_offset = offset + 5
+    end = offset + su_len
+    while cr_offset < end:
+        (cr_flags, len_cp) = _COMP_HDR_FMT.unpack_from(rrstr, cr_offset)
+        cr_offset += 2
+
+        components.append(component_class(cr_flags, len_cp,
+                                          rrstr[cr_offset:cr_offset + len_cp]))
+
+        # FIXME: if this is the last component in this record, but the
+        # component continues on in the next record, we will fail to record
+        # this bit.  We should fix that.
+
+        cr_offset += len_cp
+
+    return components
 
 
 class RRSLRecord(object):
@@ -859,7 +1048,9 @@ class RRSLRecord(object):
     component entry, and individual components may be split across multiple
     Symbolic Link records.  This class takes care of all of those details.
     """
-    __slots__ = ('_initialized', 'symlink_components', 'flags')
+    __slots__ = ('_initialized', 'symlink_components', 'flags', '_length')
+
+    FMT = _SUSP_HDR_BYTE_FMT
 
     class Component(object):
         """A class that represents one component of a Symbolic Link Record."""
@@ -867,10 +1058,10 @@ class RRSLRecord(object):
 
         def __init__(self, flags, length, data):
             # type: (int, int, bytes) -> None
-            if flags not in (0, 1, 2, 4, 8):
+            if not 0 <= flags <= 0xff or not _SL_VALID_FLAGS[flags]:
                 raise pycdlibexception.PyCdlibInternalError('Invalid Rock Ridge symlink flags 0x%x' % (flags))
 
-            if (flags & (1 << 1) or flags & (1 << 2) or flags & (1 << 3)) and length != 0:
+            if _SL_FLAG_NAMES[flags] is not None and length != 0:
                 raise pycdlibexception.PyCdlibInternalError('Rock Ridge symlinks to dot, dotdot, or root should have zero length')
 
             # A Component can't both be a continuation and one of dot, dotdot,
@@ -891,12 +1082,9 @@ class RRSLRecord(object):
             Returns:
              Human readable name of this component.
             """
-            if self.flags & (1 << 1):
-                return b'.'
-            if self.flags & (1 << 2):
-                return b'..'
-            if self.flags & (1 << 3):
-                return b'/'
+            special = _SL_FLAG_NAMES[self.flags]
+            if special is not None:
+                return special
 
             return self.data
 
@@ -924,13 +1112,13 @@ class RRSLRecord(object):
              Representation of this compnent suitable for writing to disk.
             """
             if self.flags & (1 << 1):
-                return struct.pack('=BB', (1 << 1), 0)
+                return _SL_DOT_RECORD
             if self.flags & (1 << 2):
-                return struct.pack('=BB', (1 << 2), 0)
+                return _SL_DOTDOT_RECORD
             if self.flags & (1 << 3):
-                return struct.pack('=BB', (1 << 3), 0)
+                return _SL_ROOT_RECORD
 
-            return struct.pack('=BB', self.flags, self.curr_length) + self.data
+            return _COMP_HDR_FMT.pack(self.flags, self.curr_length) + self.data
 
         def set_continued(self):
             # type: () -> None
@@ -966,7 +1154,7 @@ class RRSLRecord(object):
              Length of symlink component plus overhead.
             """
             length = 2
-            if symlink_component not in (b'.', b'..', b'/'):
+            if symlink_component not in _SL_SPECIAL:
                 length += len(symlink_component)
 
             return length
@@ -1013,46 +1201,32 @@ class RRSLRecord(object):
         # type: () -> None
         self.symlink_components = []  # type: List[RRSLRecord.Component]
         self.flags = 0
+        self._length = RRSLRecord.header_length()
         self._initialized = False
 
-    def parse(self, rrstr):
-        # type: (bytes) -> None
+    def parse(self, rrstr, offset=0):
+        # type: (bytes, int) -> None
         """
         Parse a Rock Ridge Symbolic Link record out of a string.
 
         Parameters:
          rrstr - The string to parse the record out of.
+         offset - The offset into the string at which the record starts.
         Returns:
          Nothing.
         """
         if self._initialized:
             raise pycdlibexception.PyCdlibInternalError('SL record already initialized')
 
-        (su_len, su_entry_version_unused,
-         self.flags) = struct.unpack_from('=BBB', rrstr[:5], 2)
+        (sig_unused, su_len, su_entry_version_unused,
+         self.flags) = self.FMT.unpack_from(rrstr, offset)
 
         # We assume that the caller has already checked the su_entry_version,
         # so we don't bother.
 
-        cr_offset = 5
-        data_len = su_len - 5
-        while data_len > 0:
-            (cr_flags, len_cp) = struct.unpack_from('=BB',
-                                                    rrstr[:cr_offset + 2],
-                                                    cr_offset)
-
-            data_len -= 2
-            cr_offset += 2
-
-            self.symlink_components.append(self.Component(cr_flags, len_cp,
-                                                          rrstr[cr_offset:cr_offset + len_cp]))
-
-            # FIXME: if this is the last component in this SL record,
-            # but the component continues on in the next SL record, we will
-            # fail to record this bit.  We should fix that.
-
-            cr_offset += len_cp
-            data_len -= len_cp
+        self.symlink_components = _parse_components(rrstr, offset, su_len,
+                                                    self.Component)
+        self._length = RRSLRecord.length([comp.name() for comp in self.symlink_components])
 
         self._initialized = True
 
@@ -1084,10 +1258,12 @@ class RRSLRecord(object):
         if not self._initialized:
             raise pycdlibexception.PyCdlibInternalError('SL record not initialized')
 
-        if (self.current_length() + RRSLRecord.Component.length(symlink_comp)) > 255:
+        comp_length = RRSLRecord.Component.length(symlink_comp)
+        if (self._length + comp_length) > 255:
             raise pycdlibexception.PyCdlibInvalidInput('Symlink would be longer than 255')
 
         self.symlink_components.append(self.Component.factory(symlink_comp))
+        self._length += comp_length
 
     def current_length(self):
         # type: () -> int
@@ -1102,11 +1278,9 @@ class RRSLRecord(object):
         if not self._initialized:
             raise pycdlibexception.PyCdlibInternalError('SL record not initialized')
 
-        strlist = []
-        for comp in self.symlink_components:
-            strlist.append(comp.name())
-
-        return RRSLRecord.length(strlist)
+        # The length is kept up-to-date as components are added, so that
+        # building up a long symlink one component at a time isn't quadratic.
+        return self._length
 
     def record(self):
         # type: () -> bytes
@@ -1121,10 +1295,8 @@ class RRSLRecord(object):
         if not self._initialized:
             raise pycdlibexception.PyCdlibInternalError('SL record not initialized')
 
-        outlist = [b'SL', struct.pack('=BBB',
-                                      self.current_length(),
-                                      SU_ENTRY_VERSION,
-                                      self.flags)]
+        outlist = [self.FMT.pack(b'SL', self._length,
+                                 SU_ENTRY_VERSION, self.flags)]
         for comp in self.symlink_components:
             outlist.append(comp.record())
 
@@ -1271,6 +1443,8 @@ class RRALRecord(object):
     """
     __slots__ = ('_initialized', 'flags', 'components')
 
+    FMT = _SUSP_HDR_BYTE_FMT
+
     class Component(object):
         """A class that represents one component of an Arbitrary Attribute."""
         __slots__ = ('flags', 'curr_length', 'data')
@@ -1295,7 +1469,7 @@ class RRALRecord(object):
             Returns:
              Representation of this compnent suitable for writing to disk.
             """
-            return struct.pack('=BB', self.flags, self.curr_length) + self.data
+            return _COMP_HDR_FMT.pack(self.flags, self.curr_length) + self.data
 
         def set_continued(self):
             # type: () -> None
@@ -1352,44 +1526,28 @@ class RRALRecord(object):
         self.components = []  # type: List[RRALRecord.Component]
         self._initialized = False
 
-    def parse(self, rrstr):
-        # type: (bytes) -> None
+    def parse(self, rrstr, offset=0):
+        # type: (bytes, int) -> None
         """
         Parse an Arbitrary Attribute record out of a string.
 
         Parameters:
          rrstr - The string to parse the record out of.
+         offset - The offset into the string at which the record starts.
         Returns:
          Nothing.
         """
         if self._initialized:
             raise pycdlibexception.PyCdlibInternalError('AL record already initialized')
 
-        (su_len, su_entry_version_unused,
-         self.flags) = struct.unpack_from('=BBB', rrstr[:5], 2)
+        (sig_unused, su_len, su_entry_version_unused,
+         self.flags) = self.FMT.unpack_from(rrstr, offset)
 
         # We assume that the caller has already checked the su_entry_version,
         # so we don't bother.
 
-        cr_offset = 5
-        data_len = su_len - 5
-        while data_len > 0:
-            (cr_flags, len_cp) = struct.unpack_from('=BB',
-                                                    rrstr[:cr_offset + 2],
-                                                    cr_offset)
-
-            data_len -= 2
-            cr_offset += 2
-
-            self.components.append(self.Component(cr_flags, len_cp,
-                                                  rrstr[cr_offset:cr_offset + len_cp]))
-
-            # FIXME: if this is the last component in this AL record,
-            # but the component continues on in the next AL record, we will
-            # fail to record this bit.  We should fix that.
-
-            cr_offset += len_cp
-            data_len -= len_cp
+        self.components = _parse_components(rrstr, offset, su_len,
+                                            self.Component)
 
         self._initialized = True
 
@@ -1425,10 +1583,10 @@ class RRALRecord(object):
         if not self._initialized:
             raise pycdlibexception.PyCdlibInternalError('AL record not initialized')
 
-        outlist = [b'AL', struct.pack('=BBB',
-                                      self.current_length(),
-                                      SU_ENTRY_VERSION,
-                                      self.flags)]
+        outlist = [self.FMT.pack(b'AL',
+                                 self.current_length(),
+                                 SU_ENTRY_VERSION,
+                                 self.flags)]
         for comp in self.components:
             outlist.append(comp.record())
 
@@ -1548,7 +1706,7 @@ class RRNMRecord(object):
     """A class that represents a Rock Ridge Alternate Name record."""
     __slots__ = ('_initialized', 'posix_name_flags', 'posix_name')
 
-    FMT = '=BBB'
+    FMT = _SUSP_HDR_BYTE_FMT
 
     def __init__(self):
         # type: () -> None
@@ -1556,21 +1714,22 @@ class RRNMRecord(object):
         self.posix_name_flags = 0
         self.posix_name = b''
 
-    def parse(self, rrstr):
-        # type: (bytes) -> None
+    def parse(self, rrstr, offset=0):
+        # type: (bytes, int) -> None
         """
         Parse a Rock Ridge Alternate Name record out of a string.
 
         Parameters:
          rrstr - The string to parse the record out of.
+         offset - The offset into the string at which the record starts.
         Returns:
          Nothing.
         """
         if self._initialized:
             raise pycdlibexception.PyCdlibInternalError('NM record already initialized')
 
-        (su_len, su_entry_version_unused,
-         self.posix_name_flags) = struct.unpack_from(self.FMT, rrstr[:5], 2)
+        (sig_unused, su_len, su_entry_version_unused,
+         self.posix_name_flags) = self.FMT.unpack_from(rrstr, offset)
 
         # We assume that the caller has already checked the su_entry_version,
         # so we don't bother.
@@ -1582,7 +1741,7 @@ class RRNMRecord(object):
         if name_len != 0:
             if (self.posix_name_flags & (1 << 1)) or (self.posix_name_flags & (1 << 2)) or (self.posix_name_flags & (1 << 5)):
                 raise pycdlibexception.PyCdlibInvalidISO('Invalid name in Rock Ridge NM entry (0x%x %d)' % (self.posix_name_flags, name_len))
-            self.posix_name += rrstr[5:5 + name_len]
+            self.posix_name += rrstr[offset + 5:offset + 5 + name_len]
 
         self._initialized = True
 
@@ -1617,10 +1776,9 @@ class RRNMRecord(object):
         if not self._initialized:
             raise pycdlibexception.PyCdlibInternalError('NM record not initialized')
 
-        return b'NM' + struct.pack(self.FMT,
-                                   RRNMRecord.length(self.posix_name),
-                                   SU_ENTRY_VERSION,
-                                   self.posix_name_flags) + self.posix_name
+        return self.FMT.pack(b'NM', RRNMRecord.length(self.posix_name),
+                             SU_ENTRY_VERSION,
+                             self.posix_name_flags) + self.posix_name
 
     def set_continued(self):
         # type: () -> None
@@ -1660,20 +1818,21 @@ class RRCLRecord(object):
     """
     __slots__ = ('_initialized', 'child_log_block_num')
 
-    FMT = '<BBLL'
+    FMT = _LOG_BLOCK_NUM_FMT
 
     def __init__(self):
         # type: () -> None
         self.child_log_block_num = 0
         self._initialized = False
 
-    def parse(self, rrstr):
-        # type: (bytes) -> None
+    def parse(self, rrstr, offset=0):
+        # type: (bytes, int) -> None
         """
         Parse a Rock Ridge Child Link record out of a string.
 
         Parameters:
          rrstr - The string to parse the record out of.
+         offset - The offset into the string at which the record starts.
         Returns:
          Nothing.
         """
@@ -1683,12 +1842,12 @@ class RRCLRecord(object):
         # We assume that the caller has already checked the su_entry_version,
         # so we don't bother.
 
-        (su_len, su_entry_version_unused,
-         child_log_block_num_le, child_log_block_num_be) = struct.unpack_from(self.FMT, rrstr[:12], 2)
-        if su_len != RRCLRecord.length():
+        (sig_unused, su_len, su_entry_version_unused, child_log_block_num_le,
+         child_log_block_num_be) = self.FMT.unpack_from(rrstr, offset)
+        if su_len != _CL_LEN:
             raise pycdlibexception.PyCdlibInvalidISO('Invalid length on rock ridge extension')
 
-        if child_log_block_num_le != utils.swab_32bit(child_log_block_num_be):
+        if _BE32_FMT.pack(child_log_block_num_le) != child_log_block_num_be:
             raise pycdlibexception.PyCdlibInvalidISO('Little endian block num does not equal big endian; corrupt ISO')
         self.child_log_block_num = child_log_block_num_le
 
@@ -1724,11 +1883,10 @@ class RRCLRecord(object):
         if not self._initialized:
             raise pycdlibexception.PyCdlibInternalError('CL record not initialized')
 
-        return b'CL' + struct.pack(self.FMT,
-                                   RRCLRecord.length(),
-                                   SU_ENTRY_VERSION,
-                                   self.child_log_block_num,
-                                   utils.swab_32bit(self.child_log_block_num))
+        return self.FMT.pack(b'CL', _CL_LEN,
+                             SU_ENTRY_VERSION,
+                             self.child_log_block_num,
+                             _BE32_FMT.pack(self.child_log_block_num))
 
     def set_log_block_num(self, bl):
         # type: (int) -> None
@@ -1757,7 +1915,7 @@ class RRCLRecord(object):
         Returns:
          The length of this record in bytes.
         """
-        return 12
+        return _CL_LEN
 
 
 class RRPLRecord(object):
@@ -1768,20 +1926,21 @@ class RRPLRecord(object):
     """
     __slots__ = ('_initialized', 'parent_log_block_num')
 
-    FMT = '<BBLL'
+    FMT = _LOG_BLOCK_NUM_FMT
 
     def __init__(self):
         # type: () -> None
         self.parent_log_block_num = 0
         self._initialized = False
 
-    def parse(self, rrstr):
-        # type: (bytes) -> None
+    def parse(self, rrstr, offset=0):
+        # type: (bytes, int) -> None
         """
         Parse a Rock Ridge Parent Link record out of a string.
 
         Parameters:
          rrstr - The string to parse the record out of.
+         offset - The offset into the string at which the record starts.
         Returns:
          Nothing.
         """
@@ -1791,11 +1950,11 @@ class RRPLRecord(object):
         # We assume that the caller has already checked the su_entry_version,
         # so we don't bother.
 
-        (su_len, su_entry_version_unused,
-         parent_log_block_num_le, parent_log_block_num_be) = struct.unpack_from(self.FMT, rrstr[:12], 2)
-        if su_len != RRPLRecord.length():
+        (sig_unused, su_len, su_entry_version_unused, parent_log_block_num_le,
+         parent_log_block_num_be) = self.FMT.unpack_from(rrstr, offset)
+        if su_len != _PL_LEN:
             raise pycdlibexception.PyCdlibInvalidISO('Invalid length on rock ridge extension')
-        if parent_log_block_num_le != utils.swab_32bit(parent_log_block_num_be):
+        if _BE32_FMT.pack(parent_log_block_num_le) != parent_log_block_num_be:
             raise pycdlibexception.PyCdlibInvalidISO('Little endian block num does not equal big endian; corrupt ISO')
         self.parent_log_block_num = parent_log_block_num_le
 
@@ -1831,11 +1990,11 @@ class RRPLRecord(object):
         if not self._initialized:
             raise pycdlibexception.PyCdlibInternalError('PL record not initialized')
 
-        return b'PL' + struct.pack(self.FMT,
-                                   RRPLRecord.length(),
-                                   SU_ENTRY_VERSION,
-                                   self.parent_log_block_num,
-                                   utils.swab_32bit(self.parent_log_block_num))
+        return self.FMT.pack(b'PL',
+                             _PL_LEN,
+                             SU_ENTRY_VERSION,
+                             self.parent_log_block_num,
+                             _BE32_FMT.pack(self.parent_log_block_num))
 
     def set_log_block_num(self, bl):
         # type: (int) -> None
@@ -1864,7 +2023,7 @@ class RRPLRecord(object):
         Returns:
          The length of this record in bytes.
         """
-        return 12
+        return _PL_LEN
 
 
 class RRTFRecord(object):
@@ -1881,9 +2040,9 @@ class RRTFRecord(object):
                  'modification_time', 'attribute_change_time', 'backup_time',
                  'expiration_time', 'effective_time', 'time_flags')
 
-    FIELDNAMES = ('creation_time', 'access_time', 'modification_time',
-                  'attribute_change_time', 'backup_time', 'expiration_time',
-                  'effective_time')
+    FMT = _SUSP_HDR_BYTE_FMT
+
+    FIELDNAMES = tuple(fieldname for fieldname, mask_unused in _TF_FIELDS)
 
     def __init__(self):
         # type: () -> None
@@ -1893,13 +2052,14 @@ class RRTFRecord(object):
         self.time_flags = 0
         self._initialized = False
 
-    def parse(self, rrstr):
-        # type: (bytes) -> None
+    def parse(self, rrstr, offset=0):
+        # type: (bytes, int) -> None
         """
         Parse a Rock Ridge Time Stamp record out of a string.
 
         Parameters:
          rrstr - The string to parse the record out of.
+         offset - The offset into the string at which the record starts.
         Returns:
          Nothing.
         """
@@ -1909,24 +2069,27 @@ class RRTFRecord(object):
         # We assume that the caller has already checked the su_entry_version,
         # so we don't bother.
 
-        (su_len, su_entry_version_unused,
-         self.time_flags) = struct.unpack_from('=BBB', rrstr[:5], 2)
+        (sig_unused, su_len, su_entry_version_unused,
+         self.time_flags) = self.FMT.unpack_from(rrstr, offset)
         if su_len < 5:
             raise pycdlibexception.PyCdlibInvalidISO('Not enough bytes in the TF record')
 
+        # All of the timestamps in the record are the same style, so figure
+        # out the style once rather than for each timestamp.
         tflen = 7
-        if self.time_flags & (1 << 7):
+        date_class = dates.DirectoryRecordDate  # type: Any
+        if self.time_flags & _TF_LONG_FORM:
             tflen = 17
+            date_class = dates.VolumeDescriptorDate
 
-        offset = 5
-        for index, fieldname in enumerate(self.FIELDNAMES):
-            if self.time_flags & (1 << index):
-                if tflen == 7:
-                    setattr(self, fieldname, dates.DirectoryRecordDate())
-                elif tflen == 17:
-                    setattr(self, fieldname, dates.VolumeDescriptorDate())
-                getattr(self, fieldname).parse(rrstr[offset:offset + tflen])
-                offset += tflen
+        time_flags = self.time_flags
+        field_offset = offset + 5
+        for fieldname, mask in _TF_FIELDS:
+            if time_flags & mask:
+                date = date_class()
+                date.parse(rrstr[field_offset:field_offset + tflen])
+                setattr(self, fieldname, date)
+                field_offset += tflen
 
         self._initialized = True
 
@@ -1947,17 +2110,15 @@ class RRTFRecord(object):
 
         self.time_flags = time_flags
 
-        tflen = 7
-        if self.time_flags & (1 << 7):
-            tflen = 17
+        date_class = dates.DirectoryRecordDate  # type: Any
+        if self.time_flags & _TF_LONG_FORM:
+            date_class = dates.VolumeDescriptorDate
 
-        for index, fieldname in enumerate(self.FIELDNAMES):
-            if self.time_flags & (1 << index):
-                if tflen == 7:
-                    setattr(self, fieldname, dates.DirectoryRecordDate())
-                elif tflen == 17:
-                    setattr(self, fieldname, dates.VolumeDescriptorDate())
-                getattr(self, fieldname).new(date_seconds)
+        for fieldname, mask in _TF_FIELDS:
+            if self.time_flags & mask:
+                date = date_class()
+                date.new(date_seconds)
+                setattr(self, fieldname, date)
 
         self._initialized = True
 
@@ -1974,10 +2135,10 @@ class RRTFRecord(object):
         if not self._initialized:
             raise pycdlibexception.PyCdlibInternalError('TF record not initialized')
 
-        outlist = [b'TF', struct.pack('=BBB',
-                                      RRTFRecord.length(self.time_flags),
-                                      SU_ENTRY_VERSION,
-                                      self.time_flags)]
+        outlist = [self.FMT.pack(b'TF',
+                                 RRTFRecord.length(self.time_flags),
+                                 SU_ENTRY_VERSION,
+                                 self.time_flags)]
         for fieldname in self.FIELDNAMES:
             field = getattr(self, fieldname)
             if field is not None:
@@ -1998,13 +2159,11 @@ class RRTFRecord(object):
          The length of this record in bytes.
         """
         tf_each_size = 7
-        if time_flags & (1 << 7):
+        if time_flags & _TF_LONG_FORM:
             tf_each_size = 17
-        time_flags &= 0x7f
-        tf_num = 0
-        while time_flags:
-            time_flags &= time_flags - 1
-            tf_num += 1
+        # One timestamp is present for each of the low 7 bits that is set;
+        # count them in C rather than looping in Python.
+        tf_num = bin(time_flags & _TF_TIMESTAMPS_MASK).count('1')
 
         return 5 + tf_each_size * tf_num
 
@@ -2017,6 +2176,14 @@ class RRSFRecord(object):
     __slots__ = ('_initialized', 'virtual_file_size_high',
                  'virtual_file_size_low', 'table_depth')
 
+    FMT = _SUSP_HDR_FMT
+    # The file sizes start after the 4-byte SUSP header.  See RRCERecord for
+    # how the both-endian fields are parsed.
+    SIZES_LE_FMT = struct.Struct('<L4xL4xB')
+    SIZES_BE_FMT = struct.Struct('>4xL4xL')
+    SIZE_REC_FMT = struct.Struct('<L4s')
+    SIZES_REC_FMT = struct.Struct('<L4sL4sB')
+
     def __init__(self):
         # type: () -> None
         self.table_depth = None  # type: Optional[int]
@@ -2024,13 +2191,14 @@ class RRSFRecord(object):
         self.virtual_file_size_high = None  # type: Optional[int]
         self._initialized = False
 
-    def parse(self, rrstr):
-        # type: (bytes) -> None
+    def parse(self, rrstr, offset=0):
+        # type: (bytes, int) -> None
         """
         Parse a Rock Ridge Sparse File record out of a string.
 
         Parameters:
          rrstr - The string to parse the record out of.
+         offset - The offset into the string at which the record starts.
         Returns:
          Nothing.
         """
@@ -2040,23 +2208,26 @@ class RRSFRecord(object):
         # We assume that the caller has already checked the su_entry_version,
         # so we don't bother.
 
-        (su_len,
-         su_entry_version_unused) = struct.unpack_from('=BB', rrstr[:4], 2)
+        (sig_unused, su_len,
+         su_entry_version_unused) = self.FMT.unpack_from(rrstr, offset)
 
         if su_len == 12:
             # This is a Rock Ridge version 1.10 SF Record, which is 12 bytes.
-            (virtual_file_size_le, virtual_file_size_be) = struct.unpack_from('<LL', rrstr[:12], 4)
-            if virtual_file_size_le != utils.swab_32bit(virtual_file_size_be):
+            (virtual_file_size_le,) = _LE32_FMT.unpack_from(rrstr, offset + 4)
+            (virtual_file_size_be,) = _BE32_FMT.unpack_from(rrstr, offset + 8)
+            if virtual_file_size_le != virtual_file_size_be:
                 raise pycdlibexception.PyCdlibInvalidISO('Virtual file size little-endian does not match big-endian')
             self.virtual_file_size_low = virtual_file_size_le
         elif su_len == 21:
             # This is a Rock Ridge version 1.12 SF Record, which is 21 bytes.
-            (virtual_file_size_high_le, virtual_file_size_high_be, virtual_file_size_low_le,
-             virtual_file_size_low_be, self.table_depth) = struct.unpack_from('<LLLLB', rrstr[:21], 4)
-            if virtual_file_size_high_le != utils.swab_32bit(virtual_file_size_high_be):
+            (virtual_file_size_high_le, virtual_file_size_low_le,
+             self.table_depth) = self.SIZES_LE_FMT.unpack_from(rrstr, offset + 4)
+            (virtual_file_size_high_be,
+             virtual_file_size_low_be) = self.SIZES_BE_FMT.unpack_from(rrstr, offset + 4)
+            if virtual_file_size_high_le != virtual_file_size_high_be:
                 raise pycdlibexception.PyCdlibInvalidISO('Virtual file size high little-endian does not match big-endian')
 
-            if virtual_file_size_low_le != utils.swab_32bit(virtual_file_size_low_be):
+            if virtual_file_size_low_le != virtual_file_size_low_be:
                 raise pycdlibexception.PyCdlibInvalidISO('Virtual file size low little-endian does not match big-endian')
             self.virtual_file_size_low = virtual_file_size_low_le
             self.virtual_file_size_high = virtual_file_size_high_le
@@ -2102,20 +2273,18 @@ class RRSFRecord(object):
         length = 12
         if self.virtual_file_size_high is not None:
             length = 21
-        ret = b'SF' + struct.pack('=BB', length, SU_ENTRY_VERSION)
+        outlist = [self.FMT.pack(b'SF', length, SU_ENTRY_VERSION)]
         if self.virtual_file_size_high is not None and self.table_depth is not None:
-            ret += struct.pack('<LLLLB',
-                               self.virtual_file_size_high,
-                               utils.swab_32bit(self.virtual_file_size_high),
-                               self.virtual_file_size_low,
-                               utils.swab_32bit(self.virtual_file_size_low),
-                               self.table_depth)
+            outlist.append(self.SIZES_REC_FMT.pack(self.virtual_file_size_high,
+                                                   _BE32_FMT.pack(self.virtual_file_size_high),
+                                                   self.virtual_file_size_low,
+                                                   _BE32_FMT.pack(self.virtual_file_size_low),
+                                                   self.table_depth))
         else:
-            ret += struct.pack('<LL',
-                               self.virtual_file_size_low,
-                               utils.swab_32bit(self.virtual_file_size_low))
+            outlist.append(self.SIZE_REC_FMT.pack(self.virtual_file_size_low,
+                                                  _BE32_FMT.pack(self.virtual_file_size_low)))
 
-        return ret
+        return b''.join(outlist)
 
     @staticmethod
     def length(rr_version):
@@ -2146,27 +2315,31 @@ class RRRERecord(object):
     """
     __slots__ = ('_initialized',)
 
-    FMT = '=BB'
+    FMT = _SUSP_HDR_FMT
+
+    # The record never changes.
+    _RECORD = FMT.pack(b'RE', _RE_LEN, SU_ENTRY_VERSION)
 
     def __init__(self):
         # type: () -> None
         self._initialized = False
 
-    def parse(self, rrstr):
-        # type: (bytes) -> None
+    def parse(self, rrstr, offset=0):
+        # type: (bytes, int) -> None
         """
         Parse a Rock Ridge Relocated Directory record out of a string.
 
         Parameters:
          rrstr - The string to parse the record out of.
+         offset - The offset into the string at which the record starts.
         Returns:
          Nothing.
         """
         if self._initialized:
             raise pycdlibexception.PyCdlibInternalError('RE record already initialized')
 
-        (su_len,
-         su_entry_version_unused) = struct.unpack_from(self.FMT, rrstr[:4], 2)
+        (sig_unused, su_len,
+         su_entry_version_unused) = self.FMT.unpack_from(rrstr, offset)
 
         # We assume that the caller has already checked the su_entry_version,
         # so we don't bother.
@@ -2205,9 +2378,7 @@ class RRRERecord(object):
         if not self._initialized:
             raise pycdlibexception.PyCdlibInternalError('RE record not initialized')
 
-        return b'RE' + struct.pack(self.FMT,
-                                   RRRERecord.length(),
-                                   SU_ENTRY_VERSION)
+        return self._RECORD
 
     @staticmethod
     def length():
@@ -2221,7 +2392,7 @@ class RRRERecord(object):
         Returns:
          The length of this record in bytes.
         """
-        return 4
+        return _RE_LEN
 
 
 class RRSTRecord(object):
@@ -2232,27 +2403,31 @@ class RRSTRecord(object):
     """
     __slots__ = ('_initialized',)
 
-    FMT = '=BB'
+    FMT = _SUSP_HDR_FMT
+
+    # The record never changes.
+    _RECORD = FMT.pack(b'ST', _ST_LEN, SU_ENTRY_VERSION)
 
     def __init__(self):
         # type: () -> None
         self._initialized = False
 
-    def parse(self, rrstr):
-        # type: (bytes) -> None
+    def parse(self, rrstr, offset=0):
+        # type: (bytes, int) -> None
         """
         Parse a Rock Ridge System Terminator record out of a string.
 
         Parameters:
          rrstr - The string to parse the record out of.
+         offset - The offset into the string at which the record starts.
         Returns:
          Nothing.
         """
         if self._initialized:
             raise pycdlibexception.PyCdlibInternalError('ST record already initialized')
 
-        (su_len,
-         su_entry_version_unused) = struct.unpack_from(self.FMT, rrstr[:4], 2)
+        (sig_unused, su_len,
+         su_entry_version_unused) = self.FMT.unpack_from(rrstr, offset)
 
         # We assume that the caller has already checked the su_entry_version,
         # so we don't bother.
@@ -2291,9 +2466,7 @@ class RRSTRecord(object):
         if not self._initialized:
             raise pycdlibexception.PyCdlibInternalError('ST record not initialized')
 
-        return b'ST' + struct.pack(self.FMT,
-                                   RRSTRecord.length(),
-                                   SU_ENTRY_VERSION)
+        return self._RECORD
 
     @staticmethod
     def length():
@@ -2307,7 +2480,7 @@ class RRSTRecord(object):
         Returns:
          The length of this record in bytes.
         """
-        return 4
+        return _ST_LEN
 
 
 class RRPDRecord(object):
@@ -2318,29 +2491,30 @@ class RRPDRecord(object):
     """
     __slots__ = ('_initialized', 'padding')
 
-    FMT = '=BB'
+    FMT = _SUSP_HDR_FMT
 
     def __init__(self):
         # type: () -> None
         self._initialized = False
 
-    def parse(self, rrstr):
-        # type: (bytes) -> None
+    def parse(self, rrstr, offset=0):
+        # type: (bytes, int) -> None
         """
         Parse a Rock Ridge Platform Dependent record out of a string.
 
         Parameters:
          rrstr - The string to parse the record out of.
+         offset - The offset into the string at which the record starts.
         Returns:
          Nothing.
         """
         if self._initialized:
             raise pycdlibexception.PyCdlibInternalError('PD record already initialized')
 
-        (su_len_unused,
-         su_entry_version_unused) = struct.unpack_from(self.FMT, rrstr[:4], 2)
+        (sig_unused, su_len_unused,
+         su_entry_version_unused) = self.FMT.unpack_from(rrstr, offset)
 
-        self.padding = rrstr[4:]
+        self.padding = rrstr[offset + 4:]
 
         # We assume that the caller has already checked the su_entry_version,
         # so we don't bother.
@@ -2377,8 +2551,8 @@ class RRPDRecord(object):
         if not self._initialized:
             raise pycdlibexception.PyCdlibInternalError('PD record not initialized')
 
-        return b'PD' + struct.pack(self.FMT, RRPDRecord.length(self.padding),
-                                   SU_ENTRY_VERSION) + self.padding
+        return self.FMT.pack(b'PD', RRPDRecord.length(self.padding),
+                             SU_ENTRY_VERSION) + self.padding
 
     @staticmethod
     def length(padding):
@@ -2395,6 +2569,39 @@ class RRPDRecord(object):
         return 4 + len(padding)
 
 
+# The lengths of the records that are generated with the same contents for
+# every new Rock Ridge entry, so that they only have to be computed once.
+_PX_LENGTHS = dict((rr_version, RRPXRecord.length(rr_version))
+                   for rr_version in ('1.09', '1.10', '1.12'))
+_TF_LEN = RRTFRecord.length(TF_FLAGS)
+_ER_109_LEN = RRERRecord.length(EXT_ID_109, EXT_DES_109, EXT_SRC_109)
+_ER_112_LEN = RRERRecord.length(EXT_ID_112, EXT_DES_112, EXT_SRC_112)
+
+
+# A map from the signature of each SUSP or Rock Ridge entry that can be parsed
+# to the class that parses it, the name of the RockRidgeEntries attribute that
+# it is stored in, and whether there can be more than one of that entry.
+_RECORD_TYPES = {
+    b'SP': (RRSPRecord, 'sp_record', False),
+    b'RR': (RRRRRecord, 'rr_record', False),
+    b'CE': (RRCERecord, 'ce_record', False),
+    b'PX': (RRPXRecord, 'px_record', False),
+    b'PD': (RRPDRecord, 'pd_records', True),
+    b'ST': (RRSTRecord, 'st_record', False),
+    b'ER': (RRERRecord, 'er_record', False),
+    b'ES': (RRESRecord, 'es_records', True),
+    b'PN': (RRPNRecord, 'pn_record', False),
+    b'SL': (RRSLRecord, 'sl_records', True),
+    b'NM': (RRNMRecord, 'nm_records', True),
+    b'CL': (RRCLRecord, 'cl_record', False),
+    b'PL': (RRPLRecord, 'pl_record', False),
+    b'RE': (RRRERecord, 're_record', False),
+    b'TF': (RRTFRecord, 'tf_record', False),
+    b'SF': (RRSFRecord, 'sf_record', False),
+    b'AL': (RRALRecord, 'al_records', True),
+}  # type: Dict[bytes, Tuple[Any, str, bool]]
+
+
 class RockRidgeEntries(object):
     """
     A simple class container to hold a long list of possible Rock Ridge
@@ -2440,7 +2647,7 @@ class RockRidge(object):
     """A class representing Rock Ridge entries."""
     __slots__ = ('_initialized', 'dr_entries', 'ce_entries', 'cl_to_moved_dr',
                  'moved_to_cl_dr', 'parent_link', 'rr_version', 'ce_block',
-                 'bytes_to_skip', '_full_name')
+                 'bytes_to_skip', '_full_name', '_px_record')
 
     def __init__(self):
         # type: () -> None
@@ -2451,6 +2658,7 @@ class RockRidge(object):
         self.parent_link = None  # type: Optional[dr.DirectoryRecord]
         self.rr_version = ''
         self.ce_block = None  # type: Optional[RockRidgeContinuationBlock]
+        self._px_record = None  # type: Optional[RRPXRecord]
         self._initialized = False
 
     def has_entry(self, name):
@@ -2504,99 +2712,58 @@ class RockRidge(object):
         has_es_record = False
         sf_record_length = None
         er_id = None
+        # Bind the per-record lookups to locals; this loop runs once per
+        # System Use entry of every directory record.
+        unpack_susp_hdr = _SUSP_HDR_FMT.unpack_from
+        get_record_type = _RECORD_TYPES.get
         while True:
             if left == 0:
                 break
             if left == 1:
                 # There may be a padding byte on the end.
-                if bytes(bytearray([record[offset]])) != b'\x00':
+                if record[offset:offset + 1] != b'\x00':
                     raise pycdlibexception.PyCdlibInvalidISO('Invalid pad byte')
                 break
             if left < 4:
                 raise pycdlibexception.PyCdlibInvalidISO('Not enough bytes left in the System Use field')
 
-            (rtype, su_len, su_entry_version) = struct.unpack_from('=2sBB', record[:offset + 4], offset)
+            (rtype, su_len, su_entry_version) = unpack_susp_hdr(record, offset)
             if su_entry_version != SU_ENTRY_VERSION:
                 raise pycdlibexception.PyCdlibInvalidISO('Invalid RR version %d!' % su_entry_version)
             if su_len == 0:
                 raise pycdlibexception.PyCdlibInvalidISO('Zero size for Rock Ridge entry length')
 
-            recslice = record[offset:]
-
-            if rtype in (b'SP', b'RR', b'CE', b'PX', b'ST', b'ER',
-                         b'PN', b'CL', b'PL', b'RE', b'TF', b'SF'):
-                recname = rtype.decode('utf-8').lower() + '_record'
-                if self.has_entry(recname):
-                    raise pycdlibexception.PyCdlibInvalidISO('Only single %s record supported' % (rtype.decode('utf-8')))
-
-            if rtype == b'SP':
-                if left < 7 or not is_first_dir_record_of_root:
-                    raise pycdlibexception.PyCdlibInvalidISO('Invalid SUSP SP record')
-
-                # OK, this is the first Directory Record of the root
-                # directory, which means we should check it for the SUSP/RR
-                # extension, which is exactly 7 bytes and starts with 'SP'.
-
-                entry_list.sp_record = RRSPRecord()
-                entry_list.sp_record.parse(recslice)
-            elif rtype == b'RR':
-                entry_list.rr_record = RRRRRecord()
-                entry_list.rr_record.parse(recslice)
-            elif rtype == b'CE':
-                entry_list.ce_record = RRCERecord()
-                entry_list.ce_record.parse(recslice)
-            elif rtype == b'PX':
-                entry_list.px_record = RRPXRecord()
-                px_record_length = entry_list.px_record.parse(recslice)
-            elif rtype == b'PD':
-                pd = RRPDRecord()
-                pd.parse(recslice)
-                entry_list.pd_records.append(pd)
-            elif rtype == b'ST':
-                entry_list.st_record = RRSTRecord()
-                entry_list.st_record.parse(recslice)
+            record_type = get_record_type(rtype)
+            if record_type is None:
+                raise pycdlibexception.PyCdlibInvalidISO('Unknown SUSP record')
+            (record_class, attrname, multiple) = record_type
+
+            if not multiple and self.has_entry(attrname):
+                raise pycdlibexception.PyCdlibInvalidISO('Only single %s record supported' % (rtype.decode('utf-8')))
+
+            if rtype == b'SP' and (left < 7 or not is_first_dir_record_of_root):
+                # The SP record is only valid in the first Directory Record of
+                # the root directory, and is exactly 7 bytes.
+                raise pycdlibexception.PyCdlibInvalidISO('Invalid SUSP SP record')
+
+            new_record = record_class()
+            parse_ret = new_record.parse(record, offset)
+            if multiple:
+                getattr(entry_list, attrname).append(new_record)
+            else:
+                setattr(entry_list, attrname, new_record)
+
+            # A few of the records give hints as to the Rock Ridge version;
+            # see below.
+            if rtype == b'PX':
+                px_record_length = parse_ret
             elif rtype == b'ER':
-                entry_list.er_record = RRERRecord()
-                entry_list.er_record.parse(recslice)
-                er_id = entry_list.er_record.ext_id
+                er_id = new_record.ext_id
             elif rtype == b'ES':
-                es = RRESRecord()
-                es.parse(recslice)
-                entry_list.es_records.append(es)
                 has_es_record = True
-            elif rtype == b'PN':
-                entry_list.pn_record = RRPNRecord()
-                entry_list.pn_record.parse(recslice)
-            elif rtype == b'SL':
-                new_sl_record = RRSLRecord()
-                new_sl_record.parse(recslice)
-                entry_list.sl_records.append(new_sl_record)
-            elif rtype == b'NM':
-                new_nm_record = RRNMRecord()
-                new_nm_record.parse(recslice)
-                entry_list.nm_records.append(new_nm_record)
-            elif rtype == b'CL':
-                entry_list.cl_record = RRCLRecord()
-                entry_list.cl_record.parse(recslice)
-            elif rtype == b'PL':
-                entry_list.pl_record = RRPLRecord()
-                entry_list.pl_record.parse(recslice)
-            elif rtype == b'RE':
-                entry_list.re_record = RRRERecord()
-                entry_list.re_record.parse(recslice)
-            elif rtype == b'TF':
-                entry_list.tf_record = RRTFRecord()
-                entry_list.tf_record.parse(recslice)
             elif rtype == b'SF':
-                entry_list.sf_record = RRSFRecord()
-                entry_list.sf_record.parse(recslice)
-                sf_record_length = len(recslice)
-            elif rtype == b'AL':
-                new_al_record = RRALRecord()
-                new_al_record.parse(recslice)
-                entry_list.al_records.append(new_al_record)
-            else:
-                raise pycdlibexception.PyCdlibInvalidISO('Unknown SUSP record')
+                sf_record_length = len(record) - offset
+
             offset += su_len
             left -= su_len
 
@@ -2636,8 +2803,27 @@ class RockRidge(object):
         else:
             self._full_name = dr_name
 
+        self._update_px_record()
+
         self._initialized = True
 
+    def _update_px_record(self):
+        # type: () -> None
+        """
+        An internal method to remember which of the DR or CE entries holds the
+        PX record, so that the file mode and link accessors don't have to look
+        in both each time.
+
+        Parameters:
+         None.
+        Returns:
+         Nothing.
+        """
+        px_record = self.dr_entries.px_record
+        if px_record is None:
+            px_record = self.ce_entries.px_record
+        self._px_record = px_record
+
     def _record(self, entries):
         # type: (RockRidgeEntries) -> bytes
         """
@@ -2755,7 +2941,8 @@ class RockRidge(object):
         # Note that the component header length can never be longer than the SL
         # entry length.  Thus, we are reduced to 2 lengths to worry about.
 
-        if curr_dr_len + RRSLRecord.length(symlink_path.split(b'/')) > ALLOWED_DR_SIZE:
+        components = symlink_path.split(b'/')
+        if curr_dr_len + RRSLRecord.length(components) > ALLOWED_DR_SIZE:
             if self.dr_entries.ce_record is None:
                 return -1
 
@@ -2764,6 +2951,10 @@ class RockRidge(object):
 
         sl_rec_header_len = RRSLRecord.header_length()
 
+        # The length of everything that ends up in the continuation entry;
+        # this is added to the CE record once at the end.
+        ce_len = 0
+
         thislen = RRSLRecord.length([b'a'])
         if curr_dr_len + thislen < ALLOWED_DR_SIZE:
             # There is enough room in the directory record for at least
@@ -2774,14 +2965,16 @@ class RockRidge(object):
             sl_in_dr = True
         else:
             # Not enough room in the directory record, so proceed to
-            # the continuation entry directly.
+            # the continuation entry directly.  Without a CE record there is
+            # nowhere to put it; fail so that the caller can retry with one.
+            if self.dr_entries.ce_record is None:
+                return -1
             curr_comp_area_length = RRSLRecord.maximum_component_area_length()
             self.ce_entries.sl_records.append(curr_sl)
-            if self.dr_entries.ce_record is not None:
-                self.dr_entries.ce_record.add_record(sl_rec_header_len)
+            ce_len += sl_rec_header_len
             sl_in_dr = False
 
-        for index, comp in enumerate(symlink_path.split(b'/')):
+        for index, comp in enumerate(components):
             special = False
             if index == 0 and comp == b'':
                 comp = b'/'
@@ -2796,10 +2989,10 @@ class RockRidge(object):
             else:
                 mincomp = b'a'
 
+            minimum = RRSLRecord.Component.length(mincomp)
             offset = 0
             done = False
             while not done:
-                minimum = RRSLRecord.Component.length(mincomp)
                 if minimum > curr_comp_area_length:
                     # There wasn't enough room in the last SL record
                     # for more data.  Set the 'continued' flag on the old
@@ -2812,12 +3005,15 @@ class RockRidge(object):
                         # header as continued.
                         curr_sl.set_last_component_continued()
 
+                    # The new record has to go in the continuation entry.
+                    if self.dr_entries.ce_record is None:
+                        return -1
+
                     curr_sl = RRSLRecord()
                     curr_sl.new()
                     self.ce_entries.sl_records.append(curr_sl)
                     curr_comp_area_length = RRSLRecord.maximum_component_area_length()
-                    if self.dr_entries.ce_record is not None:
-                        self.dr_entries.ce_record.add_record(sl_rec_header_len)
+                    ce_len += sl_rec_header_len
                     sl_in_dr = False
 
                 if special:
@@ -2825,20 +3021,23 @@ class RockRidge(object):
                     length = 0
                     compslice = comp
                 else:
-                    complen = RRSLRecord.Component.length(comp[offset:])
+                    compslice = comp[offset:]
+                    complen = RRSLRecord.Component.length(compslice)
                     if complen > curr_comp_area_length:
+                        # Only part of the rest of the component fits in
+                        # this SL record.
                         length = curr_comp_area_length - 2
+                        compslice = compslice[:length]
+                        complen = RRSLRecord.Component.length(compslice)
                     else:
                         length = complen
-                    compslice = comp[offset:offset + length]
 
                 curr_sl.add_component(compslice)
 
                 if sl_in_dr:
-                    curr_dr_len += RRSLRecord.Component.length(compslice)
+                    curr_dr_len += complen
                 else:
-                    if self.dr_entries.ce_record is not None:
-                        self.dr_entries.ce_record.add_record(RRSLRecord.Component.length(compslice))
+                    ce_len += complen
 
                 offset += length
 
@@ -2850,6 +3049,9 @@ class RockRidge(object):
                     if offset >= len(comp):
                         done = True
 
+        if ce_len and self.dr_entries.ce_record is not None:
+            self.dr_entries.ce_record.add_record(ce_len)
+
         return curr_dr_len
 
     def _new_attributes(self, attributes, curr_dr_len):
@@ -2873,6 +3075,10 @@ class RockRidge(object):
 
         al_rec_header_len = RRALRecord.header_length()
 
+        # The length of everything that ends up in the continuation entry;
+        # this is added to the CE record once at the end.
+        ce_len = 0
+
         thislen = RRALRecord.length([b'a'])
         if curr_dr_len + thislen < ALLOWED_DR_SIZE:
             # There is enough room in the directory record for at least
@@ -2883,10 +3089,12 @@ class RockRidge(object):
             al_in_dr = True
         else:
             # Not enough room in the directory record, so proceed to
-            # the continuation entry directly.
+            # the continuation entry directly.  Without a CE record there is
+            # nowhere to put it; fail so that the caller can retry with one.
+            if self.dr_entries.ce_record is None:
+                return -1
             curr_comp_area_length = RRALRecord.maximum_component_area_length()
-            if self.dr_entries.ce_record is not None:
-                self.dr_entries.ce_record.add_record(al_rec_header_len)
+            ce_len += al_rec_header_len
             self.ce_entries.al_records.append(curr_al)
             al_in_dr = False
 
@@ -2907,12 +3115,15 @@ class RockRidge(object):
                         # header as continued.
                         curr_al.set_last_component_continued()
 
+                    # The new record has to go in the continuation entry.
+                    if self.dr_entries.ce_record is None:
+                        return -1
+
                     curr_al = RRALRecord()
                     curr_al.new()
                     self.ce_entries.al_records.append(curr_al)
                     curr_comp_area_length = RRALRecord.maximum_component_area_length()
-                    if self.dr_entries.ce_record is not None:
-                        self.dr_entries.ce_record.add_record(al_rec_header_len)
+                    ce_len += al_rec_header_len
                     al_in_dr = False
 
                 complen = RRALRecord.Component.length(attr[offset:])
@@ -2927,8 +3138,7 @@ class RockRidge(object):
                 if al_in_dr:
                     curr_dr_len += RRALRecord.Component.length(compslice)
                 else:
-                    if self.dr_entries.ce_record is not None:
-                        self.dr_entries.ce_record.add_record(RRALRecord.Component.length(compslice))
+                    ce_len += RRALRecord.Component.length(compslice)
 
                 offset += length
 
@@ -2937,6 +3147,9 @@ class RockRidge(object):
                 if offset >= len(attr):
                     done = True
 
+        if ce_len and self.dr_entries.ce_record is not None:
+            self.dr_entries.ce_record.add_record(ce_len)
+
         return curr_dr_len
 
     def _add_name(self, rr_name, curr_dr_len):
@@ -2962,8 +3175,9 @@ class RockRidge(object):
         # the RR record, and the combination of them is never > 203, so we will
         # always put some NM data in here.
 
+        name_len = len(rr_name)
         len_here = ALLOWED_DR_SIZE - curr_dr_len - 5
-        if len_here < len(rr_name):
+        if len_here < name_len:
             # If there isn't room in the DR entry for the entire name, we know
             # we need a CE record to fit it.
             if self.dr_entries.ce_record is None:
@@ -2973,13 +3187,14 @@ class RockRidge(object):
 
         curr_nm = None
         if len_here > 0:
+            name_here = rr_name[:len_here]
             curr_nm = RRNMRecord()
-            curr_nm.new(rr_name[:len_here])
+            curr_nm.new(name_here)
             self.dr_entries.nm_records.append(curr_nm)
-            curr_dr_len += RRNMRecord.length(rr_name[:len_here])
+            curr_dr_len += RRNMRecord.length(name_here)
 
         offset = len_here
-        while offset < len(rr_name):
+        while offset < name_len:
             if self.dr_entries.ce_record is None:
                 return -1
 
@@ -2988,17 +3203,44 @@ class RockRidge(object):
 
             # We clip the length for this NM entry to 250, as that is
             # the maximum possible size for an NM entry.
-            length = min(len(rr_name[offset:]), 250)
+            length = min(name_len - offset, 250)
+            name_piece = rr_name[offset:offset + length]
 
             curr_nm = RRNMRecord()
-            curr_nm.new(rr_name[offset:offset + length])
+            curr_nm.new(name_piece)
             self.ce_entries.nm_records.append(curr_nm)
-            self.dr_entries.ce_record.add_record(RRNMRecord.length(rr_name[offset:offset + length]))
+            self.dr_entries.ce_record.add_record(RRNMRecord.length(name_piece))
 
             offset += length
 
         return curr_dr_len
 
+    def _assign_record(self, attrname, new_record, thislen, curr_dr_len):
+        # type: (str, Any, int, int) -> int
+        """
+        An internal method to place a single fixed-size record in the directory
+        record if it fits there, or in the continuation entry otherwise.
+
+        Parameters:
+         attrname - The RockRidgeEntries attribute to store the record in.
+         new_record - The record to place.
+         thislen - The length of the record.
+         curr_dr_len - The current directory record length.
+        Returns:
+         The new directory record length, or -1 if the record does not fit in
+         the directory record and there is no continuation entry.
+        """
+        if curr_dr_len + thislen > ALLOWED_DR_SIZE:
+            if self.dr_entries.ce_record is None:
+                return -1
+            self.dr_entries.ce_record.add_record(thislen)
+            setattr(self.ce_entries, attrname, new_record)
+        else:
+            curr_dr_len += thislen
+            setattr(self.dr_entries, attrname, new_record)
+
+        return curr_dr_len
+
     def _assign_entries(self, is_first_dir_record_of_root, rr_name, file_mode,
                         symlink_path, rr_relocated_child, rr_relocated,
                         rr_relocated_parent, bytes_to_skip, curr_dr_len,
@@ -3029,44 +3271,63 @@ class RockRidge(object):
          The length of the directory record after the Rock Ridge extension has
          been added, or -1 if the entry will not fit.
         """
-        # For SP Record
+        # The length of each of the fixed-size records, or 0 if the record is
+        # not needed.
+        sp_len = 0
+        er_len = 0
         if is_first_dir_record_of_root:
+            sp_len = _SP_LEN
+            if self.rr_version in ('1.09', '1.10'):
+                er_len = _ER_109_LEN
+            else:
+                # Assume 1.12
+                er_len = _ER_112_LEN
+        rr_len = _RR_LEN if self.rr_version == '1.09' else 0
+        px_len = _PX_LENGTHS[self.rr_version]
+        cl_len = _CL_LEN if rr_relocated_child else 0
+        re_len = _RE_LEN if rr_relocated else 0
+        pl_len = _PL_LEN if rr_relocated_parent else 0
+
+        if self.dr_entries.ce_record is None:
+            # Without a continuation entry, all of the records have to fit in
+            # the directory record.  If they can't, fail before building any of
+            # them, so that the caller can go straight to retrying with one.
+            all_entries_len = curr_dr_len + sp_len + rr_len + px_len + _TF_LEN
+            all_entries_len += cl_len + re_len + pl_len + er_len
+            if rr_name:
+                all_entries_len += RRNMRecord.length(rr_name)
+            if symlink_path:
+                all_entries_len += RRSLRecord.length(symlink_path.split(b'/'))
+            if attributes:
+                all_entries_len += RRALRecord.length(list(attributes.keys()) + list(attributes.values()))
+            if all_entries_len > ALLOWED_DR_SIZE:
+                return -1
+
+        # For SP Record
+        if sp_len:
             new_sp = RRSPRecord()
             new_sp.new(bytes_to_skip)
-            thislen = RRSPRecord.length()
-            if curr_dr_len + thislen > ALLOWED_DR_SIZE:
-                if self.dr_entries.ce_record is None:
-                    # In reality, this can never happen.  If the SP record pushes
-                    # us over the DR limit, then there is no room for a CE record
-                    # either, and we are going to fail.  We leave this in place
-                    # both for consistency with other records and to keep mypy
-                    # happy.
-                    return -1
-                self.dr_entries.ce_record.add_record(thislen)
-                self.ce_entries.sp_record = new_sp
-            else:
-                curr_dr_len += thislen
-                self.dr_entries.sp_record = new_sp
+            # In reality, this can never fail.  If the SP record pushes us over
+            # the DR limit, then there is no room for a CE record either, and
+            # we are going to fail.  We check anyway for consistency with the
+            # other records.
+            curr_dr_len = self._assign_record('sp_record', new_sp, sp_len,
+                                              curr_dr_len)
+            if curr_dr_len < 0:
+                return -1
 
-        # For RR Record
+        # For RR Record.  The fields it marks as present are collected as the
+        # other records are assigned, and set on it at the end.
         rr_record = None
-        if self.rr_version == '1.09':
+        rr_fields = 0
+        if rr_len:
             rr_record = RRRRRecord()
             rr_record.new()
-            thislen = RRRRRecord.length()
-            if curr_dr_len + thislen > ALLOWED_DR_SIZE:
-                if self.dr_entries.ce_record is None:
-                    # In reality, this can never happen.  If the RR record pushes
-                    # us over the DR limit, then there is no room for a CE record
-                    # either, and we are going to fail.  We leave this in place
-                    # both for consistency with other records and to keep mypy
-                    # happy.
-                    return -1
-                self.dr_entries.ce_record.add_record(thislen)
-                self.ce_entries.rr_record = rr_record
-            else:
-                curr_dr_len += thislen
-                self.dr_entries.rr_record = rr_record
+            # As with the SP record, this can never fail in reality.
+            curr_dr_len = self._assign_record('rr_record', rr_record, rr_len,
+                                              curr_dr_len)
+            if curr_dr_len < 0:
+                return -1
 
         # For NM record
         if rr_name:
@@ -3074,24 +3335,17 @@ class RockRidge(object):
             if curr_dr_len < 0:
                 return -1
 
-            if rr_record is not None:
-                rr_record.append_field('NM')
+            rr_fields |= _RR_NM
 
         # For PX record
         new_px = RRPXRecord()
         new_px.new(file_mode)
-        thislen = RRPXRecord.length(self.rr_version)
-        if curr_dr_len + thislen > ALLOWED_DR_SIZE:
-            if self.dr_entries.ce_record is None:
-                return -1
-            self.dr_entries.ce_record.add_record(thislen)
-            self.ce_entries.px_record = new_px
-        else:
-            curr_dr_len += thislen
-            self.dr_entries.px_record = new_px
+        curr_dr_len = self._assign_record('px_record', new_px, px_len,
+                                          curr_dr_len)
+        if curr_dr_len < 0:
+            return -1
 
-        if rr_record is not None:
-            rr_record.append_field('PX')
+        rr_fields |= _RR_PX
 
         # For SL record
         if symlink_path:
@@ -3099,95 +3353,64 @@ class RockRidge(object):
             if curr_dr_len < 0:
                 return -1
 
-            if rr_record is not None:
-                rr_record.append_field('SL')
+            rr_fields |= _RR_SL
 
         # For TF record
         new_tf = RRTFRecord()
         new_tf.new(TF_FLAGS, date_seconds)
-        thislen = RRTFRecord.length(TF_FLAGS)
-        if curr_dr_len + thislen > ALLOWED_DR_SIZE:
-            if self.dr_entries.ce_record is None:
-                return -1
-            self.dr_entries.ce_record.add_record(thislen)
-            self.ce_entries.tf_record = new_tf
-        else:
-            curr_dr_len += thislen
-            self.dr_entries.tf_record = new_tf
+        curr_dr_len = self._assign_record('tf_record', new_tf, _TF_LEN,
+                                          curr_dr_len)
+        if curr_dr_len < 0:
+            return -1
 
-        if rr_record is not None:
-            rr_record.append_field('TF')
+        rr_fields |= _RR_TF
 
         # For CL record
-        if rr_relocated_child:
+        if cl_len:
             new_cl = RRCLRecord()
             new_cl.new()
-            thislen = RRCLRecord.length()
-            if curr_dr_len + thislen > ALLOWED_DR_SIZE:
-                if self.dr_entries.ce_record is None:
-                    return -1
-                self.dr_entries.ce_record.add_record(thislen)
-                self.ce_entries.cl_record = new_cl
-            else:
-                curr_dr_len += thislen
-                self.dr_entries.cl_record = new_cl
+            curr_dr_len = self._assign_record('cl_record', new_cl, cl_len,
+                                              curr_dr_len)
+            if curr_dr_len < 0:
+                return -1
 
-            if rr_record is not None:
-                rr_record.append_field('CL')
+            rr_fields |= _RR_CL
 
         # For RE record
-        if rr_relocated:
+        if re_len:
             new_re = RRRERecord()
             new_re.new()
-            thislen = RRRERecord.length()
-            if curr_dr_len + thislen > ALLOWED_DR_SIZE:
-                if self.dr_entries.ce_record is None:
-                    return -1
-                self.dr_entries.ce_record.add_record(thislen)
-                self.ce_entries.re_record = new_re
-            else:
-                curr_dr_len += thislen
-                self.dr_entries.re_record = new_re
+            curr_dr_len = self._assign_record('re_record', new_re, re_len,
+                                              curr_dr_len)
+            if curr_dr_len < 0:
+                return -1
 
-            if rr_record is not None:
-                rr_record.append_field('RE')
+            rr_fields |= _RR_RE
 
         # For PL record
-        if rr_relocated_parent:
+        if pl_len:
             new_pl = RRPLRecord()
             new_pl.new()
-            thislen = RRPLRecord.length()
-            if curr_dr_len + thislen > ALLOWED_DR_SIZE:
-                if self.dr_entries.ce_record is None:
-                    return -1
-                self.dr_entries.ce_record.add_record(thislen)
-                self.ce_entries.pl_record = new_pl
-            else:
-                curr_dr_len += thislen
-                self.dr_entries.pl_record = new_pl
+            curr_dr_len = self._assign_record('pl_record', new_pl, pl_len,
+                                              curr_dr_len)
+            if curr_dr_len < 0:
+                return -1
 
-            if rr_record is not None:
-                rr_record.append_field('PL')
+            rr_fields |= _RR_PL
 
         # For ER record
-        if is_first_dir_record_of_root:
+        if er_len:
             new_er = RRERRecord()
             if self.rr_version in ('1.09', '1.10'):
                 new_er.new(EXT_ID_109, EXT_DES_109, EXT_SRC_109)
-                thislen = RRERRecord.length(EXT_ID_109, EXT_DES_109, EXT_SRC_109)
             else:
                 # Assume 1.12
                 new_er.new(EXT_ID_112, EXT_DES_112, EXT_SRC_112)
-                thislen = RRERRecord.length(EXT_ID_112, EXT_DES_112, EXT_SRC_112)
 
-            if curr_dr_len + thislen > ALLOWED_DR_SIZE:
-                if self.dr_entries.ce_record is None:
-                    return -1
-                self.dr_entries.ce_record.add_record(thislen)
-                self.ce_entries.er_record = new_er
-            else:
-                curr_dr_len += thislen
-                self.dr_entries.er_record = new_er
+            curr_dr_len = self._assign_record('er_record', new_er, er_len,
+                                              curr_dr_len)
+            if curr_dr_len < 0:
+                return -1
 
         # For AL record
         if attributes:
@@ -3195,6 +3418,9 @@ class RockRidge(object):
             if curr_dr_len < 0:
                 return -1
 
+        if rr_record is not None:
+            rr_record.append_fields(rr_fields)
+
         return curr_dr_len
 
     def new(self, is_first_dir_record_of_root, rr_name, file_mode,
@@ -3238,8 +3464,8 @@ class RockRidge(object):
 
         self.rr_version = rr_version
 
-        new_dr_len = self._assign_entries(is_first_dir_record_of_root, rr_name,
-                                          file_mode, symlink_path,
+        new_dr_len = self._assign_entries(is_first_dir_record_of_root,
+                                          rr_name, file_mode, symlink_path,
                                           rr_relocated_child, rr_relocated,
                                           rr_relocated_parent, bytes_to_skip,
                                           curr_dr_len, attributes, date_seconds)
@@ -3250,7 +3476,7 @@ class RockRidge(object):
 
             self.dr_entries.ce_record = RRCERecord()
             self.dr_entries.ce_record.new()
-            curr_dr_len += RRCERecord.length()
+            curr_dr_len += _CE_LEN
 
             new_dr_len = self._assign_entries(is_first_dir_record_of_root,
                                               rr_name, file_mode, symlink_path,
@@ -3269,6 +3495,8 @@ class RockRidge(object):
         namelist.extend([nm.posix_name for nm in self.ce_entries.nm_records])
         self._full_name = b''.join(namelist)
 
+        self._update_px_record()
+
         self._initialized = True
 
         return new_dr_len
@@ -3286,12 +3514,9 @@ class RockRidge(object):
         if not self._initialized:
             raise pycdlibexception.PyCdlibInternalError('Rock Ridge extension not initialized')
 
-        if self.dr_entries.px_record is None:
-            if self.ce_entries.px_record is None:
-                raise pycdlibexception.PyCdlibInvalidInput('No Rock Ridge file links')
-            self.ce_entries.px_record.posix_file_links += 1
-        else:
-            self.dr_entries.px_record.posix_file_links += 1
+        if self._px_record is None:
+            raise pycdlibexception.PyCdlibInvalidInput('No Rock Ridge file links')
+        self._px_record.posix_file_links += 1
 
     def remove_from_file_links(self):
         # type: () -> None
@@ -3306,12 +3531,9 @@ class RockRidge(object):
         if not self._initialized:
             raise pycdlibexception.PyCdlibInternalError('Rock Ridge extension not initialized')
 
-        if self.dr_entries.px_record is None:
-            if self.ce_entries.px_record is None:
-                raise pycdlibexception.PyCdlibInvalidInput('No Rock Ridge file links')
-            self.ce_entries.px_record.posix_file_links -= 1
-        else:
-            self.dr_entries.px_record.posix_file_links -= 1
+        if self._px_record is None:
+            raise pycdlibexception.PyCdlibInvalidInput('No Rock Ridge file links')
+        self._px_record.posix_file_links -= 1
 
     def copy_file_links(self, src):
         # type: (RockRidge) -> None
@@ -3328,20 +3550,14 @@ class RockRidge(object):
             raise pycdlibexception.PyCdlibInternalError('Rock Ridge extension not initialized')
 
         # First, get the src data
-        if src.dr_entries.px_record is None:
-            if src.ce_entries.px_record is None:
-                raise pycdlibexception.PyCdlibInvalidInput('No Rock Ridge file links')
-            num_links = src.ce_entries.px_record.posix_file_links
-        else:
-            num_links = src.dr_entries.px_record.posix_file_links
+        if src._px_record is None:  # pylint: disable=protected-access
+            raise pycdlibexception.PyCdlibInvalidInput('No Rock Ridge file links')
+        num_links = src._px_record.posix_file_links  # pylint: disable=protected-access
 
         # Now apply it to this record.
-        if self.dr_entries.px_record is None:
-            if self.ce_entries.px_record is None:
-                raise pycdlibexception.PyCdlibInvalidInput('No Rock Ridge file links')
-            self.ce_entries.px_record.posix_file_links = num_links
-        else:
-            self.dr_entries.px_record.posix_file_links = num_links
+        if self._px_record is None:
+            raise pycdlibexception.PyCdlibInvalidInput('No Rock Ridge file links')
+        self._px_record.posix_file_links = num_links
 
     def get_file_mode(self):
         # type: () -> int
@@ -3356,12 +3572,10 @@ class RockRidge(object):
         if not self._initialized:
             raise pycdlibexception.PyCdlibInternalError('Rock Ridge extension not initialized')
 
-        if self.dr_entries.px_record is None:
-            if self.ce_entries.px_record is None:
-                raise pycdlibexception.PyCdlibInvalidInput('No Rock Ridge file mode')
-            return self.ce_entries.px_record.posix_file_mode
+        if self._px_record is None:
+            raise pycdlibexception.PyCdlibInvalidInput('No Rock Ridge file mode')
 
-        return self.dr_entries.px_record.posix_file_mode
+        return self._px_record.posix_file_mode
 
     def name(self):
         # type: () -> bytes
@@ -3381,7 +3595,7 @@ class RockRidge(object):
     def _is_symlink(self):
         # type: () -> bool
         """Internal method to determine whether this Rock Ridge entry is a symlink."""
-        return len(self.dr_entries.sl_records) > 0 or len(self.ce_entries.sl_records) > 0
+        return bool(self.dr_entries.sl_records or self.ce_entries.sl_records)
 
     def is_symlink(self):
         # type: () -> bool
@@ -3465,10 +3679,12 @@ class RockRidge(object):
         if self.cl_to_moved_dr is None:
             raise pycdlibexception.PyCdlibInvalidInput('No child link found!')
 
+        # The records in the entry lists are always initialized, so set the
+        # block number directly rather than through set_log_block_num().
         if self.dr_entries.cl_record is not None:
-            self.dr_entries.cl_record.set_log_block_num(self.cl_to_moved_dr.extent_location())
+            self.dr_entries.cl_record.child_log_block_num = self.cl_to_moved_dr.extent_location()
         elif self.ce_entries.cl_record is not None:
-            self.ce_entries.cl_record.set_log_block_num(self.cl_to_moved_dr.extent_location())
+            self.ce_entries.cl_record.child_log_block_num = self.cl_to_moved_dr.extent_location()
         else:
             raise pycdlibexception.PyCdlibInvalidInput('Could not find child link record!')
 
@@ -3528,9 +3744,9 @@ class RockRidge(object):
             raise pycdlibexception.PyCdlibInvalidInput('No parent link found!')
 
         if self.dr_entries.pl_record is not None:
-            self.dr_entries.pl_record.set_log_block_num(self.parent_link.extent_location())
+            self.dr_entries.pl_record.parent_log_block_num = self.parent_link.extent_location()
         elif self.ce_entries.pl_record is not None:
-            self.ce_entries.pl_record.set_log_block_num(self.parent_link.extent_location())
+            self.ce_entries.pl_record.parent_log_block_num = self.parent_link.extent_location()
         else:
             raise pycdlibexception.PyCdlibInvalidInput('Could not find parent link record!')
 
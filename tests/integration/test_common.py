@@ -1140,11 +1140,7 @@ def check_twoextentfile(iso, filesize):
     # Now check the file at the root.  It should have a name of BIGFILE.;1, it
     # should have a directory record length of 44, it should start at extent 24,
     # and its contents should be the bytes 0x0-0xff, repeating 8 times plus one.
-    outstr = b''
-    for j in range(0, 8):
-        for i in range(0, 256):
-            outstr += struct.pack('=B', i)
-    outstr += struct.pack('=B', 0)
+    outstr = bytes(bytearray(range(256))) * 8 + b'\x00'
     internal_check_file(iso.pvd.root_dir_record.children[2], name=b'BIGFILE.;1', dr_len=44, loc=24, datalen=2049, hidden=False, multi_extent=False)
     internal_check_file_contents(iso, path='/BIGFILE.;1', contents=outstr, which='iso_path')
 
@@ -473,11 +473,7 @@ def test_hybrid_twoextentfile(tmpdir):
 
     iso.open(str(outfile))
 
-    outstr = b''
-    for j in range(0, 8):
-        for i in range(0, 256):
-            outstr += struct.pack('=B', i)
-    outstr += struct.pack('=B', 0)
+    outstr = bytes(bytearray(range(256))) * 8 + b'\x00'
 
     iso.add_fp(BytesIO(outstr), len(outstr), '/BIGFILE.;1')
 
@@ -10,7 +10,6 @@ try:
     from cStringIO import StringIO as BytesIO
 except ImportError:
     from io import BytesIO
-import struct
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
@@ -235,11 +234,7 @@ def test_new_twoextentfile():
     iso = pycdlib.PyCdlib()
     iso.new()
 
-    outstr = b''
-    for j in range(0, 8):
-        for i in range(0, 256):
-            outstr += struct.pack('=B', i)
-    outstr += struct.pack('=B', 0)
+    outstr = bytes(bytearray(range(256))) * 8 + b'\x00'
 
     iso.add_fp(BytesIO(outstr), len(outstr), '/BIGFILE.;1')
 
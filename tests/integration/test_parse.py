@@ -4,7 +4,6 @@ import pytest
 import subprocess
 import os
 import sys
-import struct
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
@@ -155,11 +154,7 @@ def test_parse_twoextentfile(tmpdir):
     # First set things up, and generate the ISO with genisoimage.
     indir = tmpdir.mkdir('bigfile')
     outfile = str(indir)+'.iso'
-    outstr = b''
-    for j in range(0, 8):
-        for i in range(0, 256):
-            outstr += struct.pack('=B', i)
-    outstr += struct.pack('=B', 0)
+    outstr = bytes(bytearray(range(256))) * 8 + b'\x00'
     with open(os.path.join(str(indir), 'bigfile'), 'wb') as outfp:
         outfp.write(outstr)
     subprocess.call(['genisoimage', '-v', '-v', '-iso-level', '1', '-no-pad',
@@ -144,6 +144,26 @@ def test_rrrrrecord_append_field_tf():
     rr.append_field('TF')
     assert(rr.rr_flags == 0x80)
 
+def test_rrrrrecord_append_fields_not_initialized():
+    rr = pycdlib.rockridge.RRRRRecord()
+    with pytest.raises(pycdlib.pycdlibexception.PyCdlibInternalError) as excinfo:
+        rr.append_fields(0x1)
+    assert(str(excinfo.value) == 'RR record not initialized')
+
+def test_rrrrrecord_append_fields_invalid_fields():
+    rr = pycdlib.rockridge.RRRRRecord()
+    rr.new()
+    with pytest.raises(pycdlib.pycdlibexception.PyCdlibInternalError) as excinfo:
+        rr.append_fields(0x100)
+    assert(str(excinfo.value) == 'Unknown RR field bits 0x100')
+
+def test_rrrrrecord_append_fields():
+    rr = pycdlib.rockridge.RRRRRecord()
+    rr.new()
+    rr.append_fields(0x1 | 0x80)
+    rr.append_fields(0x8)
+    assert(rr.rr_flags == 0x89)
+
 def test_rrrrrecord_record_not_initialized():
     rr = pycdlib.rockridge.RRRRRecord()
     with pytest.raises(pycdlib.pycdlibexception.PyCdlibInternalError) as excinfo:
@@ -444,6 +464,11 @@ def test_rrsl_component_bad_flags():
         com = pycdlib.rockridge.RRSLRecord.Component(0x10, 0, b'')
     assert(str(excinfo.value) == 'Invalid Rock Ridge symlink flags 0x10')
 
+def test_rrsl_component_negative_flags():
+    with pytest.raises(pycdlib.pycdlibexception.PyCdlibInternalError) as excinfo:
+        com = pycdlib.rockridge.RRSLRecord.Component(-252, 0, b'')
+    assert(str(excinfo.value) == 'Invalid Rock Ridge symlink flags 0x-fc')
+
 def test_rrsl_component_bad_length():
     with pytest.raises(pycdlib.pycdlibexception.PyCdlibInternalError) as excinfo:
         com = pycdlib.rockridge.RRSLRecord.Component(0x02, 1, b'')
@@ -566,6 +591,15 @@ def test_rrslrecord_current_length_not_initialized():
         sl.current_length()
     assert(str(excinfo.value) == 'SL record not initialized')
 
+def test_rrslrecord_current_length():
+    sl = pycdlib.rockridge.RRSLRecord()
+    sl.new()
+    assert(sl.current_length() == 5)
+    sl.add_component(b'/')
+    sl.add_component(b'foo')
+    assert(sl.current_length() == 12)
+    assert(sl.current_length() == len(sl.record()))
+
 def test_rrslrecord_record_not_initialized():
     sl = pycdlib.rockridge.RRSLRecord()
     with pytest.raises(pycdlib.pycdlibexception.PyCdlibInternalError) as excinfo:
@@ -592,6 +626,31 @@ def test_rrslrecord_name_with_continued_comp():
     sl.add_component(b'bar')
     assert(sl.name() == b'foobar')
 
+def test_rrslrecord_parse():
+    sl = pycdlib.rockridge.RRSLRecord()
+    sl.parse(b'SL\x0e\x01\x00\x08\x00\x04\x00\x00\x03foo')
+    assert(sl._initialized)
+    assert(sl.flags == 0)
+    assert(len(sl.symlink_components) == 3)
+    assert(sl.symlink_components[0].name() == b'/')
+    assert(sl.symlink_components[1].name() == b'..')
+    assert(sl.symlink_components[2].name() == b'foo')
+    assert(sl.name() == b'/../foo')
+    assert(sl.record() == b'SL\x0e\x01\x00\x08\x00\x04\x00\x00\x03foo')
+
+def test_rrslrecord_parse_slash_data():
+    sl = pycdlib.rockridge.RRSLRecord()
+    sl.parse(b'SL\x07\x01\x00\x00\x01/')
+    assert(sl.name() == b'')
+    sl = pycdlib.rockridge.RRSLRecord()
+    sl.parse(b'SL\x09\x01\x00\x00\x01/\x04\x00')
+    assert(sl.name() == b'/..')
+
+def test_rr_parse_symlink_continued_slash_data():
+    rr = pycdlib.rockridge.RockRidge()
+    rr.parse(b'SL\x08\x01\x01\x01\x01/SL\x08\x01\x00\x00\x01x', False, 0, False, b'')
+    assert(rr.symlink_path() == b'x')
+
 def test_rrslrecord_set_continued_not_initialized():
     sl = pycdlib.rockridge.RRSLRecord()
     with pytest.raises(pycdlib.pycdlibexception.PyCdlibInternalError) as excinfo:
@@ -751,6 +810,11 @@ def test_rrnmrecord_parse_invalid_flag_with_name():
         nm.parse(b'NM\x06\x01\x02a')
     assert(str(excinfo.value) == 'Invalid name in Rock Ridge NM entry (0x2 1)')
 
+def test_rrnmrecord_parse_at_offset():
+    nm = pycdlib.rockridge.RRNMRecord()
+    nm.parse(b'RR\x05\x01\x89NM\x08\x01\x00fooST\x04\x01', 5)
+    assert(nm.posix_name == b'foo')
+
 def test_rrnmrecord_new_double_initialized():
     nm = pycdlib.rockridge.RRNMRecord()
     nm.new(b'foo')
@@ -1275,6 +1339,25 @@ def test_rr_new_alrecord_ce_record_only():
     assert(rr.ce_entries.al_records[0].components[1].curr_length == 5)
     assert(rr.ce_entries.al_records[0].components[1].data == b'value')
 
+def test_rr_new_alrecord_spill_needs_ce_record():
+    rr = pycdlib.rockridge.RockRidge()
+    new_len = rr.new(False, b'foo', 0, None, '1.09', False, False, False, 0, 65, {b'name': b'v'*100}, time.time())
+    assert(new_len == 252)
+    assert(rr.dr_entries.ce_record is not None)
+    assert(len(rr.dr_entries.al_records) == 1)
+    assert(len(rr.ce_entries.al_records) == 1)
+    assert(rr.dr_entries.ce_record.len_cont_area == len(rr.record_ce_entries()))
+
+def test_rr_new_slrecord_spill_needs_ce_record():
+    rr = pycdlib.rockridge.RockRidge()
+    new_len = rr.new(False, b'nm', 0o120777, b'/'.join([b'ccccc']*22), '1.09', False, False, False, 0, 33, {}, time.time())
+    assert(new_len == 250)
+    assert(rr.dr_entries.ce_record is not None)
+    assert(len(rr.dr_entries.sl_records) == 1)
+    assert(len(rr.ce_entries.sl_records) == 1)
+    assert(rr.dr_entries.ce_record.len_cont_area == len(rr.record_ce_entries()))
+    assert(rr.symlink_path() == b'/'.join([b'ccccc']*22))
+
 def test_rr_get_file_mode_ce_record():
     rr = pycdlib.rockridge.RockRidge()
     rr.new(False, b'foo', 0, None, '1.09', False, False, False, 0, 254-28, {}, time.time())
@@ -1282,6 +1365,21 @@ def test_rr_get_file_mode_ce_record():
     assert(rr.ce_entries.px_record is not None)
     assert(rr.get_file_mode() == 0)
 
+def test_rr_file_links_ce_record():
+    rr = pycdlib.rockridge.RockRidge()
+    rr.new(False, b'foo', 0, None, '1.09', False, False, False, 0, 254-28, {}, time.time())
+    assert(rr.ce_entries.px_record is not None)
+    links = rr.ce_entries.px_record.posix_file_links
+    rr.add_to_file_links()
+    rr.add_to_file_links()
+    rr.remove_from_file_links()
+    assert(rr.ce_entries.px_record.posix_file_links == links + 1)
+    src = pycdlib.rockridge.RockRidge()
+    src.new(False, b'foo', 0, None, '1.09', False, False, False, 0, 0, {}, time.time())
+    assert(src.dr_entries.px_record is not None)
+    rr.copy_file_links(src)
+    assert(rr.ce_entries.px_record.posix_file_links == src.dr_entries.px_record.posix_file_links)
+
 def test_rr_add_to_file_links_not_initialized():
     rr = pycdlib.rockridge.RockRidge()
     with pytest.raises(pycdlib.pycdlibexception.PyCdlibInternalError) as excinfo: